@@ -7,11 +7,69 @@ comprehensive summaries including file metadata and statistical analysis.
 
 from __future__ import annotations
 
+import io
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import IO, Dict, Iterable, List, Optional, Any
 import json
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+# Tokens pandas treats as missing by default; passed to PyArrow so both
+# readers agree on null counts.
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+# Bytes PyArrow parses per block; for streamed input this is also the
+# chunk size handed to the running statistics
+ARROW_BLOCK_SIZE = 8 << 20
+
+# Without PyArrow, files at least this large have their dtypes sniffed from
+# the leading rows so the full pandas parse can skip type inference
+DTYPE_SNIFF_MIN_BYTES = 1 << 20
+DTYPE_SNIFF_ROWS = 10_000
+
+# analyze_multiple_files() only uses worker processes once the inputs
+# total this many bytes; spawning workers costs about half a second, which
+# is more than analysing small files one after another
+PARALLEL_MIN_BYTES = 64 << 20
+
+# Numerical blocks with at least this many cells are summarised with the
+# Numba kernel; for smaller ones, loading Numba costs more than it saves
+KERNEL_MIN_CELLS = 1 << 20
+
+# Relative size below which a pairwise sum of squared deviations derived
+# from raw sums is taken to be rounding error, i.e. the column is constant
+# over the rows it shares with the other column. Scaled by the row count,
+# as the rounding error of a sum grows with its length.
+CORR_RTOL = 4 * np.finfo(np.float64).eps
+
+# File name suffixes accepted by analyze_file()
+CSV_SUFFIXES = (".csv",)
+
+# Section separators used by the text summaries
+SEP80 = "=" * 80
+DASH80 = "-" * 80
+
+# dtype.kind codes of the columns that receive numerical statistics
+# (signed/unsigned int, float, complex). Nullable and Arrow-backed numeric
+# dtypes report the same kinds; timedeltas ("m") and booleans ("b") are
+# left out because their aggregates are not plain floats.
+NUMERICAL_KINDS = "iufc"
+
 
 class CSVAnalyzer:
     """
@@ -22,12 +80,19 @@ class CSVAnalyzer:
         """Initialize the CSV analyzer."""
         pass
 
-    def analyze_file(self, file_path: str | Path) -> Dict[str, Any]:
+    def analyze_file(
+        self, file_path: str | Path, sample_rows: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Analyze a single CSV file and return comprehensive information.
 
         Args:
             file_path: Path to the CSV file to analyze.
+            sample_rows: If given, compute statistics from only the first
+                sample_rows rows. The whole file is still parsed to count
+                its rows, but only the sample is loaded into a DataFrame.
+                When the file has more rows than that, the statistical
+                summary records the sample size under "sample_rows".
 
         Returns:
             Dictionary containing file summary and statistical analysis.
@@ -37,12 +102,16 @@ class CSVAnalyzer:
         if not path.exists():
             raise FileNotFoundError(f"File does not exist: {path}")
         
-        if not path.suffix.lower() == ".csv":
+        if not path.name.lower().endswith(CSV_SUFFIXES):
             raise ValueError(f"File is not a CSV: {path}")
 
         # Read the CSV file
         try:
-            df = pd.read_csv(path)
+            if sample_rows is None:
+                df = self._read_csv(path)
+                n_rows = len(df)
+            else:
+                df, n_rows = self._read_csv_sample(path, sample_rows)
         except Exception as e:
             raise RuntimeError(f"Error reading CSV file: {e}")
 
@@ -52,11 +121,235 @@ class CSVAnalyzer:
         # Generate statistical summary
         statistical_summary = self._generate_statistical_summary(df)
 
+        if len(df) < n_rows:
+            file_summary["number_of_rows"] = n_rows
+            statistical_summary["sample_rows"] = len(df)
+
         return {
             "file_summary": file_summary,
             "statistical_summary": statistical_summary,
         }
 
+    def analyze_fileobj(
+        self, fp: IO[bytes], name: str, chunksize: int = 200_000
+    ) -> Dict[str, Any]:
+        """
+        Analyze CSV data read from an open file object.
+
+        Unlike analyze_file(), no path or extension checks are made, so this
+        suits in-memory data such as uploads. The data is parsed in chunks
+        and analysed with analyze_stream(). Seekable input is parsed with
+        PyArrow when it is installed; if that fails (e.g. a later block
+        does not fit the types inferred from the first), the data is
+        re-read with pandas.
+
+        Args:
+            fp: Binary file object positioned at the start of the CSV data.
+            name: Name to report for the data source.
+            chunksize: Number of rows pandas parses per chunk.
+
+        Returns:
+            Dictionary containing file summary and statistical analysis.
+        """
+        if pacsv is not None and fp.seekable():
+            start = fp.tell()
+            try:
+                return self.analyze_stream(self._read_csv_arrow_chunks(fp), name)
+            except RuntimeError:
+                fp.seek(start)
+
+        try:
+            reader = pd.read_csv(fp, chunksize=chunksize)
+        except Exception as e:
+            raise RuntimeError(f"Error reading CSV file: {e}")
+
+        with reader as chunks:
+            return self.analyze_stream(chunks, name)
+
+    def analyze_stream(
+        self, chunks: Iterable[pd.DataFrame], file_name: str
+    ) -> Dict[str, Any]:
+        """
+        Analyze CSV data delivered as an iterable of DataFrame chunks.
+
+        Statistics are folded chunk by chunk, so the full DataFrame is never
+        materialised. Memory is not bounded, though: the non-null values of
+        every numerical column are retained (8 bytes each, as float64) so
+        medians stay exact, which is O(rows x numerical columns).
+
+        Args:
+            chunks: DataFrame chunks, e.g. from pd.read_csv(..., chunksize=n).
+            file_name: Name to report for the data source.
+
+        Returns:
+            Dictionary with the same structure as analyze_file().
+        """
+        summary = _StreamingSummary(self)
+        try:
+            for chunk in chunks:
+                summary.update(chunk)
+        except Exception as e:
+            raise RuntimeError(f"Error reading CSV file: {e}")
+
+        return {
+            "file_summary": {
+                "file_name": file_name,
+                "file_path": file_name,
+                "number_of_rows": summary.n_rows,
+                "number_of_columns": len(summary.columns),
+                "column_names": list(summary.columns),
+                "data_types": summary.data_types(),
+                "memory_usage_bytes": summary.memory_usage_bytes,
+            },
+            "statistical_summary": summary.statistical_summary(),
+        }
+
+    def _read_csv(self, path: Path) -> pd.DataFrame:
+        """
+        Read a CSV file into a DataFrame.
+
+        Uses PyArrow's multithreaded CSV reader when it is installed and
+        falls back to pandas otherwise. Files that PyArrow rejects or would
+        read differently from pandas (ragged rows, text that is not valid
+        UTF-8, duplicate or empty header names) are also read with pandas.
+
+        Args:
+            path: Path to the CSV file.
+
+        Returns:
+            Pandas DataFrame containing the CSV data.
+        """
+        if pacsv is None:
+            return self._read_csv_pandas(path)
+
+        try:
+            table = self._read_csv_arrow(path)
+            if _needs_pandas(table.schema):
+                return self._read_csv_pandas(path)
+            column_types = _arrow_column_types(table.schema) if table.num_rows else {}
+            if column_types:
+                # Arrow inferred dates or an all-null column; re-read them
+                # the way pandas does (as text and as float64)
+                table = self._read_csv_arrow(path, column_types)
+        except pa.ArrowInvalid:
+            # e.g. rows with fewer or more fields than the header, which
+            # pandas pads or reports in its own way
+            return self._read_csv_pandas(path)
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
+    def _read_csv_sample(self, path: Path, sample_rows: int) -> tuple:
+        """
+        Read the first rows of a CSV file and count all of its rows.
+
+        The count comes from parsing the whole file, so quoted values that
+        span lines are counted once, as in a full read. Uses PyArrow's
+        streaming reader when it is installed; only the sampled rows are
+        converted to pandas.
+
+        Args:
+            path: Path to the CSV file.
+            sample_rows: Number of leading rows to return.
+
+        Returns:
+            Tuple of (DataFrame of the first sample_rows rows, row count).
+        """
+        if pacsv is not None:
+            try:
+                with open(path, "rb") as fp:
+                    reader, schema = _open_csv_like_pandas(fp)
+                    batches = []
+                    n_rows = 0
+                    for batch in reader:
+                        if n_rows < sample_rows:
+                            batches.append(batch.slice(0, sample_rows - n_rows))
+                        n_rows += batch.num_rows
+                if not n_rows:
+                    return schema.empty_table().to_pandas(), 0
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+                return table.to_pandas(), n_rows
+            except (pa.ArrowInvalid, ValueError):
+                pass
+
+        sample = pd.read_csv(path, nrows=sample_rows)
+        with pd.read_csv(path, usecols=[0], chunksize=1 << 20) as chunks:
+            n_rows = sum(len(chunk) for chunk in chunks)
+        return sample, n_rows
+
+    def _read_csv_arrow(
+        self, path: Path, column_types: Optional[Dict[str, Any]] = None
+    ) -> "pa.Table":
+        """
+        Read a whole CSV file with PyArrow's multithreaded reader.
+
+        Args:
+            path: Path to the CSV file.
+            column_types: Optional column name to Arrow type overrides.
+
+        Returns:
+            PyArrow Table containing the CSV data.
+        """
+        return pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(
+                use_threads=True, block_size=ARROW_BLOCK_SIZE
+            ),
+            parse_options=_arrow_parse_options(),
+            convert_options=_arrow_convert_options(column_types),
+        )
+
+    def _read_csv_arrow_chunks(self, fp: IO[bytes]) -> Iterable[pd.DataFrame]:
+        """
+        Parse CSV data from a file object block by block with PyArrow.
+
+        Column types are inferred from the first block; a later block that
+        does not fit them raises pyarrow.ArrowInvalid. Data that is not
+        valid UTF-8 or has duplicate or empty header names raises
+        ValueError, so callers can re-read it with pandas.
+
+        Args:
+            fp: Seekable binary file object positioned at the start of the
+                CSV data.
+
+        Yields:
+            One DataFrame per parsed block; header-only data yields a single
+            empty DataFrame with the header's columns.
+        """
+        reader, schema = _open_csv_like_pandas(fp)
+        has_rows = False
+        for batch in reader:
+            has_rows = True
+            yield batch.to_pandas()
+        if not has_rows:
+            yield schema.empty_table().to_pandas()
+
+    def _read_csv_pandas(self, path: Path) -> pd.DataFrame:
+        """
+        Read a CSV file with pandas' C parser.
+
+        For large files the dtypes are inferred from the first
+        DTYPE_SNIFF_ROWS rows and passed to the full read. If a later row
+        does not fit the sniffed dtypes, the file is re-read with full
+        inference.
+
+        Args:
+            path: Path to the CSV file.
+
+        Returns:
+            Pandas DataFrame containing the CSV data.
+        """
+        if path.stat().st_size < DTYPE_SNIFF_MIN_BYTES:
+            return pd.read_csv(path)
+
+        sample = pd.read_csv(path, nrows=DTYPE_SNIFF_ROWS)
+        try:
+            return pd.read_csv(
+                path, dtype=sample.dtypes.to_dict(), engine="c", low_memory=False
+            )
+        except (ValueError, TypeError, OverflowError):
+            # e.g. text, or an integer too large for int64, in a column
+            # sniffed as numeric
+            return pd.read_csv(path, low_memory=False)
+
     def _generate_file_summary(
         self, file_path: Path, df: pd.DataFrame
     ) -> Dict[str, Any]:
@@ -94,54 +387,63 @@ class CSVAnalyzer:
         Returns:
             Dictionary with statistical information.
         """
-        # Identify numerical columns
-        numerical_cols = df.select_dtypes(include=["int64", "float64"]).columns.tolist()
+        # Split numerical and other columns in one pass over the dtypes
+        numerical_cols, non_numerical_cols = _partition_columns(df)
+        n_rows = len(df)
         
         stats = {}
         
         if numerical_cols:
-            # Basic statistics for each numerical column
+            # Compute every aggregate for all numerical columns in one call
+            # instead of one reduction per column per statistic
+            large = n_rows * len(numerical_cols) >= KERNEL_MIN_CELLS
+            if large and _load_column_stats() is not None:
+                agg_df = self._compiled_aggregates(df[numerical_cols])
+            else:
+                agg_df = df[numerical_cols].agg(
+                    ["mean", "median", "std", "min", "max", "count"]
+                )
+            # to_dict() unboxes every cell to a Python float in one call
+            agg_dict = agg_df.to_dict()
             for col in numerical_cols:
+                col_agg = agg_dict[col]
+                count = int(col_agg["count"])  # Non-null count
+                has_values = count > 0
+                null_count = n_rows - count
                 stats[col] = {
-                    "mean": float(df[col].mean()) if not df[col].isna().all() else None,
-                    "median": float(df[col].median()) if not df[col].isna().all() else None,
-                    "std": float(df[col].std()) if not df[col].isna().all() else None,
-                    "min": float(df[col].min()) if not df[col].isna().all() else None,
-                    "max": float(df[col].max()) if not df[col].isna().all() else None,
-                    "count": int(df[col].count()),  # Non-null count
-                    "null_count": int(df[col].isna().sum()),
-                    "null_percentage": float((df[col].isna().sum() / len(df)) * 100),
+                    "mean": col_agg["mean"] if has_values else None,
+                    "median": col_agg["median"] if has_values else None,
+                    "std": col_agg["std"] if has_values else None,
+                    "min": col_agg["min"] if has_values else None,
+                    "max": col_agg["max"] if has_values else None,
+                    "count": count,
+                    "null_count": null_count,
+                    "null_percentage": (null_count / n_rows) * 100 if n_rows else 0.0,
                 }
 
             # Correlation matrix for numerical columns
             if len(numerical_cols) > 1:
-                correlation_matrix = df[numerical_cols].corr()
-                stats["correlations"] = {
-                    col: {
-                        other_col: float(correlation_matrix.loc[col, other_col])
-                        for other_col in numerical_cols
-                        if col != other_col
-                    }
-                    for col in numerical_cols
-                }
+                correlation_matrix = self._correlation_matrix(df[numerical_cols])
+                stats["correlations"] = _correlations_to_dict(
+                    correlation_matrix, numerical_cols
+                )
             else:
                 stats["correlations"] = {}
         else:
             stats["correlations"] = {}
 
         # Summary of non-numerical columns
-        non_numerical_cols = df.select_dtypes(
-            exclude=["int64", "float64"]
-        ).columns.tolist()
-        
         if non_numerical_cols:
             stats["non_numerical_columns"] = {}
             for col in non_numerical_cols:
+                # One hashing pass gives unique count, nulls and the mode
+                counts = df[col].value_counts()
+                null_count = n_rows - int(counts.sum())
                 stats["non_numerical_columns"][col] = {
-                    "unique_count": int(df[col].nunique()),
-                    "null_count": int(df[col].isna().sum()),
-                    "null_percentage": float((df[col].isna().sum() / len(df)) * 100),
-                    "most_frequent": df[col].mode().tolist() if not df[col].mode().empty else [],
+                    "unique_count": len(counts),
+                    "null_count": null_count,
+                    "null_percentage": (null_count / n_rows) * 100 if n_rows else 0.0,
+                    "most_frequent": _most_frequent(counts),
                 }
 
         return {
@@ -149,6 +451,109 @@ class CSVAnalyzer:
             "statistics": stats,
         }
 
+    def _compiled_aggregates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute numerical column aggregates with the compiled kernel.
+
+        Args:
+            df: DataFrame containing only numerical columns.
+
+        Returns:
+            DataFrame indexed by statistic name with one column per input
+            column, matching ``df.agg([...])`` in _generate_statistical_summary.
+        """
+        X = np.asfortranarray(df.to_numpy(dtype=np.float64, na_value=np.nan))
+        count, finite, mean, m2, lo, hi = _load_column_stats()(X).T
+        mean, std = _mean_std(count, finite, mean, m2, lo, hi)
+        return pd.DataFrame(
+            {
+                "mean": mean,
+                "median": df.median().to_numpy(),
+                "std": std,
+                "min": lo,
+                "max": hi,
+                "count": count,
+            },
+            index=df.columns,
+        ).T
+
+    def _correlation_matrix(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Compute the Pearson correlation matrix of numerical columns.
+
+        Equivalent to ``df.corr()`` (pairwise-complete observations, with
+        infinities treated as missing and NaN for constant columns) but
+        expressed as matrix products so the work lands in BLAS.
+
+        Args:
+            df: DataFrame containing only numerical columns.
+
+        Returns:
+            Square ndarray of correlation coefficients.
+        """
+        X = df.to_numpy(dtype=np.float64, copy=True, na_value=np.nan)
+        X[np.isinf(X)] = np.nan
+        # Centering first keeps the sums small and numerically stable
+        with np.errstate(invalid="ignore", divide="ignore"):
+            X -= _column_means(X)
+
+            if len(X) and not np.isnan(X).any():
+                C = X.T @ X
+                d = np.sqrt(1.0 / np.diag(C))
+                # Constant columns stay exactly constant when centred;
+                # their rounding residue must not be read as variance
+                d[np.ptp(X, axis=0) == 0] = np.nan
+                C *= d
+                C *= d[:, None]
+                np.clip(C, -1.0, 1.0, out=C)
+                return C
+
+        return self._correlation_from_sums(*self._correlation_sums(X))
+
+    def _correlation_sums(self, X: np.ndarray) -> tuple:
+        """
+        Compute the pairwise-complete sums behind a correlation matrix.
+
+        Entry (i, j) of each sum only uses rows where both column i and
+        column j are present. Sums from separate row blocks can be added.
+        Shift each column by roughly its mean first, so the sums do not
+        cancel catastrophically in _correlation_from_sums().
+
+        Args:
+            X: 2D float64 array; NaNs and infinities are treated as missing
+                and zeroed in place.
+
+        Returns:
+            Tuple of (n, sum_x, sum_xx, sum_xy) matrices.
+        """
+        mask = ~np.isfinite(X)
+        valid = (~mask).astype(np.float64)
+        X[mask] = 0.0
+        return valid.T @ valid, X.T @ valid, (X * X).T @ valid, X.T @ X
+
+    def _correlation_from_sums(
+        self, n: np.ndarray, sx: np.ndarray, sxx: np.ndarray, sxy: np.ndarray
+    ) -> np.ndarray:
+        """
+        Turn the sums from _correlation_sums() into a correlation matrix.
+
+        Args:
+            n: Pairwise observation counts.
+            sx: Pairwise sums of x.
+            sxx: Pairwise sums of x squared.
+            sxy: Pairwise sums of x * y.
+
+        Returns:
+            Square ndarray of correlation coefficients; NaN where either
+            column is constant over the pair's rows.
+        """
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            ss = n * sxx - sx * sx
+            ss[ss <= CORR_RTOL * n * (n * sxx)] = np.nan
+            C = (n * sxy - sx * sx.T) / np.sqrt(ss * ss.T)
+        np.clip(C, -1.0, 1.0, out=C)
+        return C
+
     def format_summary(self, analysis: Dict[str, Any]) -> str:
         """
         Format the analysis results into a human-readable string.
@@ -159,87 +564,100 @@ class CSVAnalyzer:
         Returns:
             Formatted string summary.
         """
+        buf = io.StringIO()
+        self._write_summary(buf, analysis)
+        return buf.getvalue()
+
+    def _write_summary(self, buf: io.StringIO, analysis: Dict[str, Any]) -> None:
+        """
+        Write the human-readable summary of one analysis to a buffer.
+
+        Args:
+            buf: Buffer to write to.
+            analysis: Dictionary returned from analyze_file().
+        """
         file_summary = analysis["file_summary"]
         stat_summary = analysis["statistical_summary"]
 
-        output = []
-        output.append("=" * 80)
-        output.append("CSV FILE ANALYSIS SUMMARY")
-        output.append("=" * 80)
-        output.append("")
+        buf.write(SEP80 + "\n")
+        buf.write("CSV FILE ANALYSIS SUMMARY\n")
+        buf.write(SEP80 + "\n")
+        buf.write("\n")
 
         # File Summary
-        output.append("📄 FILE SUMMARY")
-        output.append("-" * 80)
-        output.append(f"File Name: {file_summary['file_name']}")
-        output.append(f"File Path: {file_summary['file_path']}")
-        output.append(f"Number of Rows: {file_summary['number_of_rows']:,}")
-        output.append(f"Number of Columns: {file_summary['number_of_columns']}")
-        output.append(f"Memory Usage: {file_summary['memory_usage_bytes']:,} bytes")
-        output.append("")
+        buf.write("📄 FILE SUMMARY\n")
+        buf.write(DASH80 + "\n")
+        buf.write(f"File Name: {file_summary['file_name']}\n")
+        buf.write(f"File Path: {file_summary['file_path']}\n")
+        buf.write(f"Number of Rows: {file_summary['number_of_rows']:,}\n")
+        buf.write(f"Number of Columns: {file_summary['number_of_columns']}\n")
+        buf.write(f"Memory Usage: {file_summary['memory_usage_bytes']:,} bytes\n")
+        buf.write("\n")
 
         # Column Information
-        output.append("📊 COLUMN INFORMATION")
-        output.append("-" * 80)
+        buf.write("📊 COLUMN INFORMATION\n")
+        buf.write(DASH80 + "\n")
         for col_name, dtype in file_summary["data_types"].items():
-            output.append(f"  • {col_name}: {dtype}")
-        output.append("")
+            buf.write(f"  • {col_name}: {dtype}\n")
+        buf.write("\n")
 
         # Statistical Summary
-        output.append("📈 STATISTICAL SUMMARY")
-        output.append("-" * 80)
+        buf.write("📈 STATISTICAL SUMMARY\n")
+        buf.write(DASH80 + "\n")
+        if "sample_rows" in stat_summary:
+            buf.write(f"(Approximate: computed from the first {stat_summary['sample_rows']:,} rows)\n")
+            buf.write("\n")
         
         numerical_cols = stat_summary["numerical_columns"]
         if numerical_cols:
-            output.append(f"Numerical Columns: {', '.join(numerical_cols)}")
-            output.append("")
+            buf.write(f"Numerical Columns: {', '.join(numerical_cols)}\n")
+            buf.write("\n")
             
             stats = stat_summary["statistics"]
             for col in numerical_cols:
                 if col in stats:
                     col_stats = stats[col]
-                    output.append(f"  Column: {col}")
+                    buf.write(f"  Column: {col}\n")
                     if col_stats["mean"] is not None:
-                        output.append(f"    Mean: {col_stats['mean']:.4f}")
-                        output.append(f"    Median: {col_stats['median']:.4f}")
-                        output.append(f"    Std Dev: {col_stats['std']:.4f}")
-                        output.append(f"    Min: {col_stats['min']:.4f}")
-                        output.append(f"    Max: {col_stats['max']:.4f}")
-                    output.append(f"    Count (non-null): {col_stats['count']:,}")
-                    output.append(f"    Null Count: {col_stats['null_count']:,} ({col_stats['null_percentage']:.2f}%)")
-                    output.append("")
+                        buf.write(f"    Mean: {col_stats['mean']:.4f}\n")
+                        buf.write(f"    Median: {col_stats['median']:.4f}\n")
+                        buf.write(f"    Std Dev: {col_stats['std']:.4f}\n")
+                        buf.write(f"    Min: {col_stats['min']:.4f}\n")
+                        buf.write(f"    Max: {col_stats['max']:.4f}\n")
+                    buf.write(f"    Count (non-null): {col_stats['count']:,}\n")
+                    buf.write(f"    Null Count: {col_stats['null_count']:,} ({col_stats['null_percentage']:.2f}%)\n")
+                    buf.write("\n")
         else:
-            output.append("No numerical columns found in this dataset.")
-            output.append("")
+            buf.write("No numerical columns found in this dataset.\n")
+            buf.write("\n")
 
         # Correlations
         if "correlations" in stat_summary["statistics"] and stat_summary["statistics"]["correlations"]:
-            output.append("🔗 CORRELATIONS (Numerical Columns)")
-            output.append("-" * 80)
+            buf.write("🔗 CORRELATIONS (Numerical Columns)\n")
+            buf.write(DASH80 + "\n")
             correlations = stat_summary["statistics"]["correlations"]
             for col1, corr_dict in correlations.items():
                 if corr_dict:  # Only show if there are correlations
-                    output.append(f"  {col1}:")
+                    buf.write(f"  {col1}:\n")
                     for col2, corr_value in corr_dict.items():
-                        output.append(f"    ↔ {col2}: {corr_value:.4f}")
-            output.append("")
+                        buf.write(f"    ↔ {col2}: {corr_value:.4f}\n")
+            buf.write("\n")
 
         # Non-numerical columns summary
         if "non_numerical_columns" in stat_summary["statistics"]:
             non_num = stat_summary["statistics"]["non_numerical_columns"]
             if non_num:
-                output.append("📝 NON-NUMERICAL COLUMNS SUMMARY")
-                output.append("-" * 80)
+                buf.write("📝 NON-NUMERICAL COLUMNS SUMMARY\n")
+                buf.write(DASH80 + "\n")
                 for col, info in non_num.items():
-                    output.append(f"  Column: {col}")
-                    output.append(f"    Unique Values: {info['unique_count']:,}")
-                    output.append(f"    Null Count: {info['null_count']:,} ({info['null_percentage']:.2f}%)")
+                    buf.write(f"  Column: {col}\n")
+                    buf.write(f"    Unique Values: {info['unique_count']:,}\n")
+                    buf.write(f"    Null Count: {info['null_count']:,} ({info['null_percentage']:.2f}%)\n")
                     if info["most_frequent"]:
-                        output.append(f"    Most Frequent: {', '.join(map(str, info['most_frequent'][:5]))}")
-                    output.append("")
+                        buf.write(f"    Most Frequent: {', '.join(map(str, info['most_frequent'][:5]))}\n")
+                    buf.write("\n")
 
-        output.append("=" * 80)
-        return "\n".join(output)
+        buf.write(SEP80)
 
     def analyze_multiple_files(
         self, file_paths: List[str | Path]
@@ -253,16 +671,41 @@ class CSVAnalyzer:
         Returns:
             Dictionary containing analysis for each file.
         """
-        results = {}
-        for file_path in file_paths:
-            try:
-                analysis = self.analyze_file(file_path)
-                results[str(Path(file_path).name)] = analysis
-            except Exception as e:
-                results[str(Path(file_path).name)] = {
-                    "error": str(e),
-                }
-        return results
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        if max_workers > 1 and _total_size(file_paths) >= PARALLEL_MIN_BYTES:
+            # Each file is independent, so parse and summarise them in
+            # separate processes; map() keeps the results in input order.
+            # Workers are spawned rather than forked: forking after the
+            # Numba kernel has started its thread pool can deadlock.
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                analyses = list(executor.map(self._analyze_or_error, file_paths))
+        else:
+            analyses = [self._analyze_or_error(path) for path in file_paths]
+
+        return {
+            str(Path(file_path).name): analysis
+            for file_path, analysis in zip(file_paths, analyses)
+        }
+
+    def _analyze_or_error(self, file_path: str | Path) -> Dict[str, Any]:
+        """
+        Analyze a single file, capturing any failure as an error entry.
+
+        Args:
+            file_path: Path to the CSV file to analyze.
+
+        Returns:
+            Analysis dictionary, or {"error": message} if analysis failed.
+        """
+        try:
+            return self.analyze_file(file_path)
+        except Exception as e:
+            return {
+                "error": str(e),
+            }
 
     def format_multiple_summaries(self, analyses: Dict[str, Any]) -> str:
         """
@@ -274,23 +717,23 @@ class CSVAnalyzer:
         Returns:
             Formatted string summary.
         """
-        output = []
-        output.append("=" * 80)
-        output.append("MULTIPLE CSV FILES ANALYSIS")
-        output.append("=" * 80)
-        output.append("")
+        buf = io.StringIO()
+        buf.write(SEP80 + "\n")
+        buf.write("MULTIPLE CSV FILES ANALYSIS\n")
+        buf.write(SEP80 + "\n")
 
         for file_name, analysis in analyses.items():
+            buf.write("\n")
             if "error" in analysis:
-                output.append(f"❌ Error analyzing {file_name}: {analysis['error']}")
-                output.append("")
+                buf.write(f"❌ Error analyzing {file_name}: {analysis['error']}")
             else:
-                output.append(self.format_summary(analysis))
-                output.append("")
+                self._write_summary(buf, analysis)
+            buf.write("\n")
 
-        return "\n".join(output)
+        return buf.getvalue()
 
-    def format_as_json(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def format_as_json(analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
         Format the analysis results as structured JSON.
 
@@ -342,6 +785,9 @@ class CSVAnalyzer:
                     "null_percentage": col_stats.get("null_percentage")
                 }
 
+        if "sample_rows" in stat_summary:
+            json_output["statistical_summary"]["sample_rows"] = stat_summary["sample_rows"]
+
         # Add correlations
         if "correlations" in stats and stats["correlations"]:
             json_output["statistical_summary"]["correlations"] = stats["correlations"]
@@ -353,6 +799,482 @@ class CSVAnalyzer:
         return json_output
 
 
+# stats_kernels.column_stats once imported by _load_column_stats(), or
+# False if Numba is not installed
+_column_stats = None
+
+
+def _load_column_stats() -> Optional[Any]:
+    """
+    Import the Numba statistics kernel on first use.
+
+    Returns:
+        stats_kernels.column_stats, or None if Numba is not installed.
+    """
+    global _column_stats
+    if _column_stats is None:
+        try:
+            from stats_kernels import column_stats
+        except ImportError:
+            column_stats = False
+        _column_stats = column_stats
+    return _column_stats or None
+
+
+def _arrow_convert_options(
+    column_types: Optional[Dict[str, Any]] = None,
+) -> "pacsv.ConvertOptions":
+    """PyArrow conversion options matching pandas' default null handling."""
+    return pacsv.ConvertOptions(
+        column_types=column_types,
+        null_values=NA_VALUES,
+        strings_can_be_null=True,
+    )
+
+
+def _arrow_parse_options() -> "pacsv.ParseOptions":
+    """
+    PyArrow parse options that allow quoted values to span lines.
+
+    Without newlines_in_values, Arrow may split a block inside a quoted
+    multi-line value and then fail on the field count.
+    """
+    return pacsv.ParseOptions(newlines_in_values=True)
+
+
+def _open_csv_arrow(
+    fp: IO[bytes], column_types: Optional[Dict[str, Any]] = None
+) -> "pacsv.CSVStreamingReader":
+    """Open a streaming PyArrow CSV reader over a binary file object."""
+    return pacsv.open_csv(
+        fp,
+        read_options=pacsv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+        parse_options=_arrow_parse_options(),
+        convert_options=_arrow_convert_options(column_types),
+    )
+
+
+def _open_csv_like_pandas(fp: IO[bytes]) -> tuple:
+    """
+    Open a streaming PyArrow reader that types columns the way pandas does.
+
+    Args:
+        fp: Seekable binary file object positioned at the start of the CSV
+            data.
+
+    Returns:
+        Tuple of (reader, schema inferred from the first block). The schema
+        precedes the type overrides; for header-only data its empty table
+        has the columns pandas would give.
+
+    Raises:
+        ValueError: If the data must be read with pandas; see _needs_pandas().
+    """
+    start = fp.tell()
+    reader = _open_csv_arrow(fp)
+    schema = reader.schema
+    if _needs_pandas(schema):
+        raise ValueError("CSV data must be read with pandas")
+    column_types = _arrow_column_types(schema)
+    if column_types:
+        # Read dates as text and empty columns as float64, like pandas
+        fp.seek(start)
+        reader = _open_csv_arrow(fp, column_types)
+    return reader, schema
+
+
+def _needs_pandas(schema: "pa.Schema") -> bool:
+    """
+    True if pandas must read the data for the result to match it.
+
+    Arrow reads text that is not valid UTF-8 as raw bytes, and keeps
+    duplicate and empty header names that pandas renames ("a.1",
+    "Unnamed: 1").
+    """
+    names = schema.names
+    return (
+        len(set(names)) != len(names)
+        or "" in names
+        or any(
+            pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type)
+            for field in schema
+        )
+    )
+
+
+def _arrow_column_types(schema: "pa.Schema") -> Dict[str, Any]:
+    """
+    Type overrides that make PyArrow read columns the way pandas does.
+
+    pandas keeps dates and times as text and reads a column with no
+    values as float64, whereas Arrow infers temporal and null types.
+    """
+    column_types = {}
+    for field in schema:
+        if pa.types.is_temporal(field.type):
+            column_types[field.name] = pa.string()
+        elif pa.types.is_null(field.type):
+            column_types[field.name] = pa.float64()
+    return column_types
+
+
+def _partition_columns(df: pd.DataFrame) -> tuple:
+    """Split column names into (numerical, non-numerical) by dtype kind."""
+    kinds = [(col, dtype.kind) for col, dtype in df.dtypes.items()]
+    numerical = [col for col, kind in kinds if kind in NUMERICAL_KINDS]
+    other = [col for col, kind in kinds if kind not in NUMERICAL_KINDS]
+    return numerical, other
+
+
+def _numerical_columns(df: pd.DataFrame) -> List[str]:
+    """Names of the columns that receive numerical statistics."""
+    return _partition_columns(df)[0]
+
+
+def _total_size(file_paths: List[str | Path]) -> int:
+    """Combined size in bytes of the given files, skipping unreadable ones."""
+    total = 0
+    for file_path in file_paths:
+        try:
+            total += os.path.getsize(file_path)
+        except OSError:
+            pass
+    return total
+
+
+def _column_means(X: np.ndarray) -> np.ndarray:
+    """
+    Column means of the finite values; columns without any give NaN
+    without warning.
+    """
+    valid = np.isfinite(X)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(valid, X, 0.0).sum(axis=0) / valid.sum(axis=0)
+
+
+def _column_moments(X: np.ndarray) -> np.ndarray:
+    """
+    Per-column moments of a 2D float array, laid out like the result of
+    stats_kernels.column_stats(). Large blocks use the Numba kernel when it
+    is available; otherwise the moments are computed with NumPy.
+    """
+    if X.size >= KERNEL_MIN_CELLS:
+        kernel = _load_column_stats()
+        if kernel is not None:
+            return kernel(np.asfortranarray(X))
+
+    valid = ~np.isnan(X)
+    finite = np.isfinite(X)
+    count = valid.sum(axis=0)
+    n_finite = finite.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(finite, X, 0.0).sum(axis=0) / n_finite
+        m2 = (np.where(finite, X - mean, 0.0) ** 2).sum(axis=0)
+    lo = np.where(valid, X, np.inf).min(axis=0, initial=np.inf)
+    hi = np.where(valid, X, -np.inf).max(axis=0, initial=-np.inf)
+    return np.column_stack([count, n_finite, mean, m2, lo, hi])
+
+
+def _mean_std(
+    count: np.ndarray,
+    finite: np.ndarray,
+    mean: np.ndarray,
+    m2: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+) -> tuple:
+    """
+    Mean and sample standard deviation as pandas reports them, from the
+    per-column moments of stats_kernels.column_stats().
+
+    A column holding +inf or -inf has that as its mean, or NaN if it holds
+    both, and any infinity makes the standard deviation NaN.
+    """
+    has_inf = finite < count
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.where(
+            has_inf | (count < 2), np.nan, np.sqrt(m2 / np.maximum(count - 1, 1))
+        )
+    inf_mean = np.where(
+        hi == np.inf, np.where(lo == -np.inf, np.nan, np.inf), -np.inf
+    )
+    return np.where(has_inf, inf_mean, mean), std
+
+
+def _correlations_to_dict(
+    C: np.ndarray, columns: List[str]
+) -> Dict[str, Dict[str, float]]:
+    """Nested {col: {other_col: r}} mapping of a correlation matrix, minus self-pairs."""
+    rows = C.tolist()
+    return {
+        col: {
+            other_col: rows[i][j]
+            for j, other_col in enumerate(columns)
+            if i != j
+        }
+        for i, col in enumerate(columns)
+    }
+
+
+def _most_frequent(counts: pd.Series) -> List[Any]:
+    """Values tied for the highest count, sorted like Series.mode()."""
+    if counts.empty:
+        return []
+    most_frequent = counts.index[counts == counts.max()].tolist()
+    try:
+        most_frequent.sort()
+    except TypeError:
+        pass
+    return most_frequent
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """Render parsed numbers back to the text pandas keeps for mixed columns."""
+    series = series.dropna()
+    if series.dtype.kind == "f" and np.all(np.mod(series, 1) == 0):
+        series = series.astype(np.int64)
+    return series.astype(str)
+
+
+def _text_counts(counts: pd.Series) -> pd.Series:
+    """Re-key value counts by the text form of their values."""
+    if counts.empty:
+        return counts
+    keys = _as_text(counts.index.to_series())
+    return counts.groupby(keys.to_numpy()).sum()
+
+
+class _StreamingSummary:
+    """
+    Running per-column statistics folded over DataFrame chunks.
+
+    Numerical columns are merged with the parallel form of Welford's
+    algorithm; non-numerical columns merge their value counts. Each
+    numerical column also keeps its non-null values for the exact median,
+    so that part of the state grows linearly with the row count.
+    """
+
+    def __init__(self, analyzer: CSVAnalyzer) -> None:
+        self.analyzer = analyzer
+        self.columns: List[str] = []
+        self.n_rows = 0
+        self.memory_usage_bytes = 0
+        self.dtypes: Dict[str, List[Any]] = {}
+        self.null_counts: Dict[str, int] = {}
+        # Numerical accumulators, keyed by column
+        self.numerical: Dict[str, Dict[str, Any]] = {}
+        # Non-numerical value counts, keyed by column
+        self.value_counts: Dict[str, pd.Series] = {}
+        # Correlation sums over the numerical columns of the first chunk
+        self.corr_cols: List[str] = []
+        self.corr_shift: Optional[np.ndarray] = None
+        self.corr_sums: Optional[List[np.ndarray]] = None
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold one chunk into the running statistics."""
+        if not self.columns:
+            self._start(chunk)
+
+        numerical_cols = set(_numerical_columns(chunk))
+        rows_before = self.n_rows
+        self.n_rows += len(chunk)
+        self.memory_usage_bytes += int(chunk.memory_usage(deep=True).sum())
+
+        chunk_numerical = []
+        for col in self.columns:
+            series = chunk[col]
+            dtypes = self.dtypes[col]
+            if series.dtype not in dtypes:
+                dtypes.append(series.dtype)
+                if (
+                    len(dtypes) == 2
+                    and col not in self.numerical
+                    and dtypes[0].kind in "biuf"
+                ):
+                    # Counts so far were keyed by parsed values; the mixed
+                    # column is text, as in a full read
+                    self.value_counts[col] = _text_counts(self.value_counts[col])
+
+            if col in self.numerical and col not in numerical_cols:
+                # Column turned out not to be numerical after all
+                self._demote(col, rows_before)
+
+            if col in self.numerical:
+                chunk_numerical.append(col)
+            else:
+                self.null_counts[col] += int(series.isna().sum())
+                if series.dtype.kind in "biuf" and len(dtypes) > 1:
+                    # A text column can parse as numbers within one chunk
+                    series = _as_text(series)
+                counts = series.value_counts(dropna=True)
+                self.value_counts[col] = self.value_counts[col].add(
+                    counts, fill_value=0
+                )
+
+        if chunk_numerical:
+            self._update_numerical(
+                chunk_numerical,
+                chunk[chunk_numerical].to_numpy(dtype=np.float64, na_value=np.nan),
+            )
+        self._update_correlations(chunk, numerical_cols)
+
+    def _start(self, chunk: pd.DataFrame) -> None:
+        """Initialise per-column state from the first chunk."""
+        self.columns = chunk.columns.tolist()
+        numerical_cols = set(_numerical_columns(chunk))
+        for col in self.columns:
+            self.dtypes[col] = []
+            self.null_counts[col] = 0
+            if col in numerical_cols:
+                # mean and m2 cover the finite values only; see _mean_std()
+                self.numerical[col] = {
+                    "count": 0, "finite": 0, "mean": 0.0, "m2": 0.0,
+                    "min": np.inf, "max": -np.inf, "values": [],
+                }
+            else:
+                self.value_counts[col] = pd.Series(dtype=np.int64)
+
+        self.corr_cols = [col for col in self.columns if col in self.numerical]
+        if len(self.corr_cols) > 1:
+            shift = _column_means(
+                chunk[self.corr_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            )
+            self.corr_shift = np.nan_to_num(shift)
+
+    def _update_numerical(self, cols: List[str], X: np.ndarray) -> None:
+        """Merge a chunk's numerical columns into the Welford accumulators."""
+        moments = _column_moments(X)
+        for index, col in enumerate(cols):
+            count_b, finite_b, mean_b, m2_b, lo_b, hi_b = moments[index].tolist()
+            if count_b == 0:
+                continue
+
+            acc = self.numerical[col]
+            values = X[:, index]
+            acc["values"].append(values[~np.isnan(values)])
+            acc["count"] += int(count_b)
+            acc["min"] = min(acc["min"], lo_b)
+            acc["max"] = max(acc["max"], hi_b)
+            if finite_b == 0:
+                continue
+
+            n_a = acc["finite"]
+            n = n_a + finite_b
+            delta = mean_b - acc["mean"]
+            acc["mean"] += delta * finite_b / n
+            acc["m2"] += m2_b + delta * delta * n_a * finite_b / n
+            acc["finite"] = int(n)
+
+    def _demote(self, col: str, rows_before: int) -> None:
+        """Move a column from numerical to non-numerical accumulation."""
+        acc = self.numerical.pop(col)
+        self.null_counts[col] = rows_before - acc["count"]
+        if acc["values"]:
+            # Each chunk was parsed on its own, so render each one separately
+            text = pd.concat(
+                [_as_text(pd.Series(values)) for values in acc["values"]]
+            )
+            counts = text.value_counts()
+        else:
+            counts = pd.Series(dtype=np.int64)
+        self.value_counts[col] = counts
+
+    def _update_correlations(
+        self, chunk: pd.DataFrame, numerical_cols: set
+    ) -> None:
+        """Add a chunk's pairwise-complete sums to the correlation totals."""
+        if self.corr_shift is None:
+            return
+
+        X = np.full((len(chunk), len(self.corr_cols)), np.nan)
+        for index, col in enumerate(self.corr_cols):
+            if col in numerical_cols:
+                X[:, index] = chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        X -= self.corr_shift
+
+        sums = self.analyzer._correlation_sums(X)
+        if self.corr_sums is None:
+            self.corr_sums = list(sums)
+        else:
+            for total, part in zip(self.corr_sums, sums):
+                total += part
+
+    def data_types(self) -> Dict[str, str]:
+        """Reconcile the dtypes seen across chunks into one per column."""
+        data_types = {}
+        for col in self.columns:
+            dtypes = self.dtypes[col]
+            if len(dtypes) == 1:
+                data_types[col] = str(dtypes[0])
+            elif col in self.numerical:
+                data_types[col] = str(np.result_type(*dtypes))
+            else:
+                # Chunks that parsed as numbers are text in the full column
+                text_dtypes = [d for d in dtypes if d.kind not in "biuf"]
+                if len(text_dtypes) == 1:
+                    data_types[col] = str(text_dtypes[0])
+                else:
+                    data_types[col] = "object"
+        return data_types
+
+    def statistical_summary(self) -> Dict[str, Any]:
+        """Build the statistical summary in the analyze_file() format."""
+        n_rows = self.n_rows
+        numerical_cols = [col for col in self.columns if col in self.numerical]
+
+        stats: Dict[str, Any] = {}
+        for col in numerical_cols:
+            acc = self.numerical[col]
+            count = acc["count"]
+            has_values = count > 0
+            null_count = n_rows - count
+            mean, std = _mean_std(
+                count, acc["finite"], acc["mean"], acc["m2"], acc["min"], acc["max"]
+            )
+            stats[col] = {
+                "mean": float(mean) if has_values else None,
+                "median": (
+                    float(np.median(np.concatenate(acc["values"])))
+                    if has_values else None
+                ),
+                "std": float(std) if has_values else None,
+                "min": float(acc["min"]) if has_values else None,
+                "max": float(acc["max"]) if has_values else None,
+                "count": count,
+                "null_count": null_count,
+                "null_percentage": (null_count / n_rows) * 100 if n_rows else 0.0,
+            }
+
+        if len(numerical_cols) > 1 and self.corr_sums is not None:
+            C = self.analyzer._correlation_from_sums(*self.corr_sums)
+            positions = [self.corr_cols.index(col) for col in numerical_cols]
+            stats["correlations"] = _correlations_to_dict(
+                C[np.ix_(positions, positions)], numerical_cols
+            )
+        else:
+            stats["correlations"] = {}
+
+        non_numerical_cols = [
+            col for col in self.columns if col not in self.numerical
+        ]
+        if non_numerical_cols:
+            stats["non_numerical_columns"] = {}
+            for col in non_numerical_cols:
+                counts = self.value_counts[col]
+                null_count = self.null_counts[col]
+                stats["non_numerical_columns"][col] = {
+                    "unique_count": len(counts),
+                    "null_count": null_count,
+                    "null_percentage": (null_count / n_rows) * 100 if n_rows else 0.0,
+                    "most_frequent": _most_frequent(counts),
+                }
+
+        return {
+            "numerical_columns": numerical_cols,
+            "statistics": stats,
+        }
+
+
 if __name__ == "__main__":
     # Simple test/demo
     import sys
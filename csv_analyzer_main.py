@@ -11,7 +11,7 @@ import sys
 from pathlib import Path
 from typing import List
 
-from csv_analyzer import CSVAnalyzer
+from csv_analyzer import CSV_SUFFIXES, CSVAnalyzer
 from csv_llm_analyzer import CSVLLMAnalyzer
 
 
@@ -58,7 +58,7 @@ def get_csv_files_from_user() -> List[Path]:
                 if response != "y":
                     continue
             
-            if file_path.suffix.lower() != ".csv":
+            if not file_path.name.lower().endswith(CSV_SUFFIXES):
                 print(f"⚠️  Warning: File does not have .csv extension: {file_path}")
                 response = input("  Continue anyway? (y/n): ").strip().lower()
                 if response != "y":
@@ -7,14 +7,24 @@ with both statistical analysis and AI-powered insights.
 
 import os
 import sys
-import io
 import json
+import time
+import hashlib
+import threading
+from decimal import Decimal
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template
 from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -26,104 +36,287 @@ if sys.platform == "win32":
 from csv_analyzer import CSVAnalyzer
 from csv_llm_analyzer import CSVLLMAnalyzer
 
+# Shared analyzer instances; both classes hold no per-request state
+_ANALYZER = CSVAnalyzer()
+_LLM = None
+_LLM_LOCK = threading.Lock()
+
+
+def get_llm():
+    """
+    Return the shared LLM analyzer, creating it on first use.
+    
+    Returns:
+        CSVLLMAnalyzer instance
+    """
+    global _LLM
+    if _LLM is None:
+        with _LLM_LOCK:
+            if _LLM is None:
+                _LLM = CSVLLMAnalyzer()
+    return _LLM
+
 
 def convert_to_native_types(obj):
     """
     Recursively convert numpy/pandas types to native Python types for JSON serialization.
     
+    Only needed when orjson is not installed; see json_response().
+    
     Args:
         obj: Object that may contain numpy/pandas types
         
     Returns:
         Object with all numpy/pandas types converted to native Python types
     """
-    # Handle pandas/numpy NaN values first
-    try:
-        if pd.isna(obj):
-            return None
-    except (TypeError, ValueError):
-        pass
-    
-    # Handle numpy integer types
-    if isinstance(obj, (np.integer, np.int64, np.int32, np.int16, np.int8)):
-        return int(obj)
-    # Handle numpy float types
-    elif isinstance(obj, (np.floating, np.float64, np.float32, np.float16)):
-        return float(obj)
-    # Handle numpy boolean types
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    # Handle numpy arrays
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    # Handle pandas Series
-    elif isinstance(obj, pd.Series):
-        return obj.tolist()
-    # Handle dictionaries
-    elif isinstance(obj, dict):
+    # Containers first: they are the most common nodes and pd.isna would
+    # raise on them
+    if isinstance(obj, dict):
         return {key: convert_to_native_types(value) for key, value in obj.items()}
-    # Handle lists and tuples
     elif isinstance(obj, (list, tuple)):
         return [convert_to_native_types(item) for item in obj]
-    # Handle strings (pandas sometimes returns object types)
     elif isinstance(obj, str):
-        return str(obj)
+        return obj
+    elif isinstance(obj, bytes):
+        return obj.decode('utf-8', 'replace')
+    # Handle plain NaN without going through pandas
+    elif isinstance(obj, float):
+        return None if obj != obj else obj
+    # Handle numpy scalars, including NaN
+    elif isinstance(obj, np.generic):
+        if pd.isna(obj):
+            return None
+        return obj.item()
+    # Handle numpy arrays and pandas Series
+    elif isinstance(obj, (np.ndarray, pd.Series)):
+        return obj.tolist()
+    # Handle pandas missing-value singletons
+    elif obj is pd.NA or obj is pd.NaT:
+        return None
     # Default: return as-is (should be a native Python type)
     else:
         return obj
 
+def json_response(payload):
+    """
+    Serialize a payload to a JSON response, using orjson when available.
+    
+    Args:
+        payload: JSON-serializable object (numpy scalars/arrays allowed)
+        
+    Returns:
+        Flask Response
+    """
+    if orjson is None:
+        return jsonify(convert_to_native_types(payload))
+    body = orjson.dumps(
+        payload,
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+    return Response(body, mimetype='application/json')
+
+def _json_default(obj):
+    """Fallback for types orjson does not serialize natively."""
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, (np.generic, pd.Series)):
+        return obj.tolist()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, bytes):
+        return obj.decode('utf-8', 'replace')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max file size
 
+# Rows parsed per chunk when streaming uploads
+CSV_CHUNK_SIZE = 200_000
+
+# Uploads handled concurrently when AI insights are requested; the OpenAI
+# round-trips are I/O bound, so this may exceed the CPU count
+AI_INSIGHTS_WORKERS = 8
+
+# Recent analyses keyed by a SHA-256 of the upload and its filename, so
+# re-submitting the same file skips parsing and AI insights can be
+# requested separately via /ai-insights. Entries of a request that defers
+# its AI insights are pinned: they are not evicted to make room and outlive
+# the TTL until /ai-insights fetches them, up to ANALYSIS_PIN_TTL. The cache
+# lives in this process, so /ai-insights requires single-process serving.
+ANALYSIS_CACHE_TTL = 60  # seconds
+ANALYSIS_PIN_TTL = 600  # seconds
+ANALYSIS_CACHE_SIZE = 32
+_ANALYSIS_CACHE = OrderedDict()
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
 # Allowed file extensions
-ALLOWED_EXTENSIONS = {'csv'}
+ALLOWED_SUFFIXES = ('.csv',)
 
 def allowed_file(filename):
     """Check if the uploaded file has an allowed extension."""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(ALLOWED_SUFFIXES)
 
-def process_csv_file(file):
+def hash_upload(file):
+    """
+    Compute the SHA-256 digest of an upload's content and filename, and
+    rewind its stream.
+    
+    Args:
+        file: Flask file object
+        
+    Returns:
+        Hex digest string, used as the analysis id
+    """
+    digest = hashlib.sha256()
+    for block in iter(lambda: file.stream.read(1 << 20), b''):
+        digest.update(block)
+    digest.update(file.filename.encode('utf-8'))
+    file.stream.seek(0)
+    return digest.hexdigest()
+
+def get_cached_analysis(key, unpin=False):
+    """
+    Return a cached analysis for key, or None if missing or expired.
+    
+    Args:
+        key: Analysis id
+        unpin: Release the entry's pin, making it evictable again
+    """
+    with _ANALYSIS_CACHE_LOCK:
+        entry = _ANALYSIS_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, analysis, pinned = entry
+        ttl = ANALYSIS_PIN_TTL if pinned else ANALYSIS_CACHE_TTL
+        if time.monotonic() - stored_at > ttl:
+            del _ANALYSIS_CACHE[key]
+            return None
+        if unpin and pinned:
+            _ANALYSIS_CACHE[key] = (time.monotonic(), analysis, False)
+        _ANALYSIS_CACHE.move_to_end(key)
+        return analysis
+
+def store_analysis(key, analysis, pin=False):
+    """
+    Cache an analysis, evicting expired and then least recently used
+    unpinned entries.
+    
+    Args:
+        key: Analysis id
+        analysis: Dictionary returned from CSVAnalyzer
+        pin: Keep the entry until /ai-insights fetches it
+    """
+    with _ANALYSIS_CACHE_LOCK:
+        entry = _ANALYSIS_CACHE.get(key)
+        pin = pin or (entry is not None and entry[2])
+        _ANALYSIS_CACHE[key] = (time.monotonic(), analysis, pin)
+        _ANALYSIS_CACHE.move_to_end(key)
+        if len(_ANALYSIS_CACHE) <= ANALYSIS_CACHE_SIZE:
+            return
+        now = time.monotonic()
+        for stale_key, (stored_at, _, pinned) in list(_ANALYSIS_CACHE.items()):
+            ttl = ANALYSIS_PIN_TTL if pinned else ANALYSIS_CACHE_TTL
+            if now - stored_at > ttl:
+                del _ANALYSIS_CACHE[stale_key]
+        unpinned = [k for k, (_, _, pinned) in _ANALYSIS_CACHE.items() if not pinned]
+        for stale_key in unpinned[:len(_ANALYSIS_CACHE) - ANALYSIS_CACHE_SIZE]:
+            del _ANALYSIS_CACHE[stale_key]
+
+def process_csv_file(file, pin=False):
     """
     Process uploaded CSV file and return analysis.
     
     Args:
         file: Flask file object
+        pin: Pin the cached analysis until /ai-insights fetches it
         
     Returns:
-        Tuple of (analysis_dict, error_message)
+        Tuple of (analysis_id, analysis_dict, error_message)
     """
     if not allowed_file(file.filename):
-        return None, "File type not allowed. Please upload CSV files only."
+        return None, None, "File type not allowed. Please upload CSV files only."
 
     try:
-        # Read file into memory
-        file_bytes = file.read()
-        
-        # Create a temporary file-like object
-        file_stream = io.BytesIO(file_bytes)
-        file_stream.seek(0)
+        analysis_id = hash_upload(file)
+        analysis = get_cached_analysis(analysis_id)
+        if analysis is not None:
+            if pin:
+                store_analysis(analysis_id, analysis, pin=True)
+            return analysis_id, analysis, None
+
+        # Parse straight from the upload stream rather than buffering it
+        # and copying it to a temporary file
+        analysis = _ANALYZER.analyze_fileobj(
+            file.stream, secure_filename(file.filename), chunksize=CSV_CHUNK_SIZE
+        )
+        store_analysis(analysis_id, analysis, pin=pin)
+        return analysis_id, analysis, None
+    except Exception as e:
+        return None, None, f"Error processing CSV file: {str(e)}"
+
+def build_ai_insights(analysis):
+    """
+    Generate AI insights for an analysis.
+    
+    Args:
+        analysis: Dictionary returned from CSVAnalyzer
         
-        # Save to temporary file for pandas
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.csv') as tmp_file:
-            tmp_file.write(file_bytes)
-            tmp_path = tmp_file.name
+    Returns:
+        Dictionary of insight sections plus the formatted text
+    """
+    llm_analyzer = get_llm()
+    insights = llm_analyzer.generate_insights(analysis)
+    return {
+        'high_level_summary': insights.get('high_level_summary', ''),
+        'key_trends': insights.get('key_trends', ''),
+        'anomalies': insights.get('anomalies', ''),
+        'beginner_explanation': insights.get('beginner_explanation', ''),
+        'formatted': llm_analyzer.format_insights(insights)
+    }
+
+def process_upload(file, include_ai_insights, defer_ai_insights=False):
+    """
+    Analyze one uploaded file and build its /analyze-csv result entry.
+    
+    Args:
+        file: Flask file object
+        include_ai_insights: Whether to generate AI insights as well
+        defer_ai_insights: Whether the client will fetch AI insights from
+            /ai-insights, so the analysis must stay cached until then
         
+    Returns:
+        Result dictionary for the response
+    """
+    analysis_id, analysis, error = process_csv_file(file, pin=defer_ai_insights)
+    if error:
+        return {
+            'filename': file.filename,
+            'error': error
+        }
+    
+    # numpy/pandas values are converted once, by json_response()
+    json_summary = CSVAnalyzer.format_as_json(analysis)
+    
+    result = {
+        'filename': file.filename,
+        'analysis_id': analysis_id,
+        'file_summary': analysis['file_summary'],
+        'statistical_summary': analysis['statistical_summary'],
+        'formatted_summary': json_summary,  # Now returns structured JSON
+        'ai_insights': None
+    }
+    
+    # Generate AI insights if requested
+    if include_ai_insights:
         try:
-            # Analyze the CSV file
-            analyzer = CSVAnalyzer()
-            analysis = analyzer.analyze_file(tmp_path)
-            return analysis, None
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(tmp_path)
-            except Exception:
-                pass
-                
-    except Exception as e:
-        return None, f"Error processing CSV file: {str(e)}"
+            result['ai_insights'] = build_ai_insights(analysis)
+        except Exception as e:
+            result['ai_insights_error'] = str(e)
+    
+    return result
 
 @app.route('/analyze-csv', methods=['POST'])
 def analyze_csv():
@@ -138,54 +331,25 @@ def analyze_csv():
         
         # Get options
         include_ai_insights = request.form.get('include_ai_insights', 'false').lower() == 'true'
+        defer_ai_insights = (
+            not include_ai_insights
+            and request.form.get('defer_ai_insights', 'false').lower() == 'true'
+        )
         
-        results = []
-        
-        for file in files:
-            if file and file.filename:
-                analysis, error = process_csv_file(file)
-                
-                if error:
-                    results.append({
-                        'filename': file.filename,
-                        'error': error
-                    })
-                else:
-                    # Convert numpy/pandas types to native Python types for JSON serialization
-                    file_summary = convert_to_native_types(analysis['file_summary'])
-                    statistical_summary = convert_to_native_types(analysis['statistical_summary'])
-                    
-                    # Format as structured JSON
-                    analyzer = CSVAnalyzer()
-                    json_summary = analyzer.format_as_json(analysis)
-                    json_summary = convert_to_native_types(json_summary)
-                    
-                    result = {
-                        'filename': file.filename,
-                        'file_summary': file_summary,
-                        'statistical_summary': statistical_summary,
-                        'formatted_summary': json_summary,  # Now returns structured JSON
-                        'ai_insights': None
-                    }
-                    
-                    # Generate AI insights if requested
-                    if include_ai_insights:
-                        try:
-                            llm_analyzer = CSVLLMAnalyzer()
-                            insights = llm_analyzer.generate_insights(analysis)
-                            result['ai_insights'] = {
-                                'high_level_summary': insights.get('high_level_summary', ''),
-                                'key_trends': insights.get('key_trends', ''),
-                                'anomalies': insights.get('anomalies', ''),
-                                'beginner_explanation': insights.get('beginner_explanation', ''),
-                                'formatted': llm_analyzer.format_insights(insights)
-                            }
-                        except Exception as e:
-                            result['ai_insights_error'] = str(e)
-                    
-                    results.append(result)
-        
-        return jsonify({
+        # Handle uploads concurrently: pandas releases the GIL while
+        # parsing and OpenAI calls wait on the network
+        uploads = [file for file in files if file and file.filename]
+        if include_ai_insights:
+            max_workers = min(len(uploads), AI_INSIGHTS_WORKERS)
+        else:
+            max_workers = min(len(uploads), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(
+                lambda file: process_upload(file, include_ai_insights, defer_ai_insights),
+                uploads
+            ))
+    
+        return json_response({
             'success': True,
             'results': results,
             'files_processed': len(results)
@@ -194,6 +358,23 @@ def analyze_csv():
     except Exception as e:
         return jsonify({'error': f'An error occurred: {str(e)}'}), 500
 
+@app.route('/ai-insights', methods=['POST'])
+def ai_insights():
+    """Generate AI insights for a file analyzed by a recent /analyze-csv call."""
+    analysis_id = request.form.get('analysis_id', '')
+    analysis = get_cached_analysis(analysis_id, unpin=True)
+    if analysis is None:
+        return jsonify({'error': 'Analysis not found or expired. Please analyze the file again.'}), 404
+    
+    try:
+        return json_response({
+            'success': True,
+            'analysis_id': analysis_id,
+            'ai_insights': build_ai_insights(analysis)
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
@@ -214,13 +395,16 @@ def api_docs():
         'message': 'CSV Analyzer API',
         'endpoints': {
             'POST /analyze-csv': 'Analyze uploaded CSV file(s)',
+            'POST /ai-insights': 'Generate AI insights for a previously analyzed file (requires single-process serving)',
             'GET /health': 'Health check',
             'GET /': 'Web interface',
             'GET /api': 'This documentation'
         },
         'parameters': {
             'files': 'Upload CSV file(s) (required)',
-            'include_ai_insights': 'Include AI-powered insights (true/false, default: false)'
+            'include_ai_insights': 'Include AI-powered insights (true/false, default: false)',
+            'defer_ai_insights': 'Keep the analyses cached until fetched from /ai-insights (true/false, default: false)',
+            'analysis_id': 'Id returned per file by /analyze-csv (required for /ai-insights)'
         }
     })
 
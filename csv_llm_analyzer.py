@@ -8,14 +8,24 @@ from the statistical analysis of CSV data.
 from __future__ import annotations
 
 import os
+import re
 import json
+import atexit
+import threading
 from typing import Dict, Any, Optional
 
+import numpy as np
+
 try:
     import openai
 except ImportError:
     openai = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # Try to load .env file
 try:
     from dotenv import load_dotenv
@@ -39,11 +49,103 @@ except ImportError:
     load_env_manually()
 
 
+# OpenAI clients shared by every CSVLLMAnalyzer in the process, keyed by
+# API key, so connections (and their TLS sessions) are reused across calls
+_CLIENTS: Dict[str, Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _build_http_client() -> Optional["httpx.Client"]:
+    """
+    Build the pooled HTTP client used by the shared OpenAI clients.
+
+    Built on openai.DefaultHttpxClient so the SDK's own timeout and
+    redirect handling are kept.
+
+    Returns:
+        httpx.Client, using HTTP/2 when the h2 package is installed, or None
+        to let the OpenAI SDK use its default transport.
+    """
+    if httpx is None:
+        return None
+
+    # Same connection cap as the SDK default, fewer idle sockets kept open
+    limits = httpx.Limits(max_connections=1000, max_keepalive_connections=32)
+    try:
+        http_client = openai.DefaultHttpxClient(http2=True, limits=limits)
+    except ImportError:
+        # HTTP/2 support needs the optional h2 package
+        http_client = openai.DefaultHttpxClient(limits=limits)
+    atexit.register(http_client.close)
+    return http_client
+
+
+def _shared_client(api_key: str) -> "openai.OpenAI":
+    """
+    Return the process-wide OpenAI client for an API key, creating it on first use.
+
+    Args:
+        api_key: OpenAI API key.
+
+    Returns:
+        openai.OpenAI instance.
+    """
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            client = openai.OpenAI(api_key=api_key, http_client=_build_http_client())
+            _CLIENTS[api_key] = client
+    return client
+
+
+# Sections returned by generate_insights()
+INSIGHT_KEYS = (
+    "high_level_summary",
+    "key_trends",
+    "anomalies",
+    "beginner_explanation",
+)
+
+
+def _compact(obj: Any) -> Any:
+    """
+    Prepare analysis values for a compact JSON prompt.
+
+    Floats are rounded to 4 decimal places, NaN becomes None and numpy
+    scalars become Python numbers.
+
+    Args:
+        obj: Value from a CSVAnalyzer analysis.
+
+    Returns:
+        JSON-friendly copy of the value.
+    """
+    if isinstance(obj, dict):
+        return {key: _compact(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_compact(item) for item in obj]
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float):
+        return None if obj != obj else round(obj, 4)
+    return obj
+
+
 class CSVLLMAnalyzer:
     """
     LLM-powered analyzer that generates insights from CSV statistical analysis.
     """
 
+    # Section headings recognised in the LLM response; each group is named
+    # after the insights key it starts
+    _SECTION_RE = re.compile(
+        r"(?P<high_level_summary>(?:1\. )?HIGH[- ]LEVEL SUMMARY)"
+        r"|(?P<key_trends>(?:2\. )?KEY TRENDS)"
+        r"|(?P<anomalies>(?:3\. )?ANOMALIES)"
+        r"|(?P<beginner_explanation>(?:4\. )?NATURAL[- ]LANGUAGE|BEGINNER)",
+        re.IGNORECASE,
+    )
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the LLM analyzer.
@@ -62,7 +164,7 @@ class CSVLLMAnalyzer:
                 "OpenAI API key not found. Set OPENAI_API_KEY environment variable or pass api_key parameter."
             )
 
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.client = _shared_client(self.api_key)
 
     def generate_insights(
         self, csv_analysis: Dict[str, Any]
@@ -85,17 +187,22 @@ class CSVLLMAnalyzer:
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a data analyst expert. Analyze CSV data and provide clear, insightful explanations. Focus on practical insights that help users understand their data.",
+                        "content": "You are a data analyst expert. Analyze CSV data and provide clear, insightful explanations. Focus on practical insights that help users understand their data. The user sends the dataset's structure and statistics as JSON. Respond with a JSON object containing the keys high_level_summary, key_trends, anomalies and beginner_explanation, each holding Markdown text.",
                     },
                     {"role": "user", "content": prompt},
                 ],
                 temperature=0.3,
+                response_format={"type": "json_object"},
             )
 
             insights_text = response.choices[0].message.content.strip()
 
-            # Parse the response into sections
-            insights = self._parse_insights(insights_text)
+            # Read the JSON sections; fall back to heading-based parsing
+            # if the model answered in plain text anyway
+            try:
+                insights = self._load_insights_json(insights_text)
+            except ValueError:
+                insights = self._parse_insights(insights_text)
 
             return insights
 
@@ -114,88 +221,120 @@ class CSVLLMAnalyzer:
         """
         file_summary = csv_analysis["file_summary"]
         stat_summary = csv_analysis["statistical_summary"]
+        stats = stat_summary["statistics"]
 
-        prompt = f"""Analyze the following CSV dataset and provide comprehensive insights.
-
-DATASET OVERVIEW:
-- File Name: {file_summary['file_name']}
-- Number of Rows: {file_summary['number_of_rows']:,}
-- Number of Columns: {file_summary['number_of_columns']}
-- Column Names: {', '.join(file_summary['column_names'])}
-
-DATA TYPES:
-{json.dumps(file_summary['data_types'], indent=2)}
-
-STATISTICAL SUMMARY:
-"""
+        dataset: Dict[str, Any] = {
+            "file_name": file_summary["file_name"],
+            "number_of_rows": file_summary["number_of_rows"],
+            "number_of_columns": file_summary["number_of_columns"],
+            "data_types": file_summary["data_types"],
+        }
+        if "sample_rows" in stat_summary:
+            dataset["statistics_sampled_from_first_rows"] = stat_summary["sample_rows"]
+
+        dataset["numerical_columns"] = {
+            col: {
+                key: stats[col][key]
+                for key in (
+                    "mean", "median", "std", "min", "max",
+                    "null_count", "null_percentage",
+                )
+            }
+            for col in stat_summary["numerical_columns"]
+            if col in stats
+        }
 
-        # Add numerical column statistics
-        if stat_summary["numerical_columns"]:
-            prompt += "\nNUMERICAL COLUMNS:\n"
-            stats = stat_summary["statistics"]
-            for col in stat_summary["numerical_columns"]:
-                if col in stats:
-                    col_stats = stats[col]
-                    prompt += f"\n{col}:\n"
-                    if col_stats["mean"] is not None:
-                        prompt += f"  - Mean: {col_stats['mean']:.4f}\n"
-                        prompt += f"  - Median: {col_stats['median']:.4f}\n"
-                        prompt += f"  - Std Dev: {col_stats['std']:.4f}\n"
-                        prompt += f"  - Min: {col_stats['min']:.4f}\n"
-                        prompt += f"  - Max: {col_stats['max']:.4f}\n"
-                    prompt += f"  - Null Count: {col_stats['null_count']:,} ({col_stats['null_percentage']:.2f}%)\n"
-
-            # Add correlations
-            if "correlations" in stats and stats["correlations"]:
-                prompt += "\nCORRELATIONS:\n"
-                for col1, corr_dict in stats["correlations"].items():
-                    for col2, corr_value in corr_dict.items():
-                        prompt += f"  - {col1} ↔ {col2}: {corr_value:.4f}\n"
-
-        # Add non-numerical column info
-        if "non_numerical_columns" in stat_summary["statistics"]:
-            non_num = stat_summary["statistics"]["non_numerical_columns"]
-            if non_num:
-                prompt += "\nNON-NUMERICAL COLUMNS:\n"
-                for col, info in non_num.items():
-                    prompt += f"\n{col}:\n"
-                    prompt += f"  - Unique Values: {info['unique_count']:,}\n"
-                    prompt += f"  - Null Count: {info['null_count']:,} ({info['null_percentage']:.2f}%)\n"
-                    if info["most_frequent"]:
-                        prompt += f"  - Most Frequent: {', '.join(map(str, info['most_frequent'][:5]))}\n"
-
-        prompt += """
-
-Please provide a comprehensive analysis in the following format:
-
-1. HIGH-LEVEL SUMMARY:
+        # Correlations are symmetric; send each pair once
+        correlations = {}
+        seen = set()
+        for col1, corr_dict in stats.get("correlations", {}).items():
+            seen.add(col1)
+            pairs = {
+                col2: value for col2, value in corr_dict.items() if col2 not in seen
+            }
+            if pairs:
+                correlations[col1] = pairs
+        if correlations:
+            dataset["correlations"] = correlations
+
+        non_num = stats.get("non_numerical_columns")
+        if non_num:
+            dataset["non_numerical_columns"] = {
+                col: {
+                    "unique_count": info["unique_count"],
+                    "null_count": info["null_count"],
+                    "null_percentage": info["null_percentage"],
+                    "most_frequent": info["most_frequent"][:5],
+                }
+                for col, info in non_num.items()
+            }
+
+        # Compact JSON costs far fewer input tokens than formatted text
+        payload = json.dumps(
+            _compact(dataset), default=str, ensure_ascii=False, separators=(",", ":")
+        )
+        return f"""Analyze the following CSV dataset and provide comprehensive insights.
+
+DATASET (JSON):
+{payload}
+
+
+Please provide a comprehensive analysis as a JSON object with the following keys, each holding Markdown text:
+
+"high_level_summary":
    - What the dataset appears to represent
    - What the key variables might mean
    - Any notable observations at first glance
 
-2. KEY TRENDS:
+"key_trends":
    - Major patterns in the data (increasing/decreasing trends, distributions)
    - Notable correlations and what they might indicate
    - Any seasonal or cyclical patterns if applicable
 
-3. ANOMALIES OR DATA ISSUES:
+"anomalies" (anomalies or data issues):
    - Unexpected missing values
    - Outlier values that stand out
    - Strange categories or values
    - Possible data entry errors
 
-4. NATURAL-LANGUAGE EXPLANATION FOR BEGINNERS:
+"beginner_explanation" (natural-language explanation for beginners):
    - Explain the key findings in simple, accessible language
    - Use analogies or examples where helpful
    - Focus on what the data means in practical terms
 
 Be specific, insightful, and practical. Use the actual numbers and statistics from the data."""
 
-        return prompt
+    def _load_insights_json(self, insights_text: str) -> Dict[str, str]:
+        """
+        Read the insight sections from a JSON response.
+
+        Args:
+            insights_text: Raw text response from LLM.
+
+        Returns:
+            Dictionary with the four insight sections; missing ones are empty.
+
+        Raises:
+            ValueError: If the response is not a JSON object.
+        """
+        data = json.loads(insights_text)
+        if not isinstance(data, dict):
+            raise ValueError("LLM response is not a JSON object")
+
+        insights = {}
+        for key in INSIGHT_KEYS:
+            value = data.get(key) or ""
+            if isinstance(value, list):
+                # Models occasionally return bullet lists as arrays
+                value = "\n".join(f"- {item}" for item in value)
+            insights[key] = str(value).strip()
+        return insights
 
     def _parse_insights(self, insights_text: str) -> Dict[str, str]:
         """
-        Parse the LLM response into structured sections.
+        Parse a plain-text LLM response into structured sections.
+
+        Fallback for responses that are not JSON.
 
         Args:
             insights_text: Raw text response from LLM.
@@ -203,52 +342,25 @@ Be specific, insightful, and practical. Use the actual numbers and statistics fr
         Returns:
             Dictionary with parsed sections.
         """
-        insights = {
-            "high_level_summary": "",
-            "key_trends": "",
-            "anomalies": "",
-            "beginner_explanation": "",
-        }
-
-        # Try to parse structured sections
-        sections = {
-            "HIGH-LEVEL SUMMARY": "high_level_summary",
-            "1. HIGH-LEVEL SUMMARY": "high_level_summary",
-            "High-Level Summary": "high_level_summary",
-            "KEY TRENDS": "key_trends",
-            "2. KEY TRENDS": "key_trends",
-            "Key Trends": "key_trends",
-            "ANOMALIES": "anomalies",
-            "3. ANOMALIES": "anomalies",
-            "Anomalies": "anomalies",
-            "ANOMALIES OR DATA ISSUES": "anomalies",
-            "NATURAL-LANGUAGE": "beginner_explanation",
-            "4. NATURAL-LANGUAGE": "beginner_explanation",
-            "Natural-Language": "beginner_explanation",
-            "BEGINNER": "beginner_explanation",
-        }
+        insights = dict.fromkeys(INSIGHT_KEYS, "")
 
         lines = insights_text.split("\n")
         current_section = None
         current_content = []
 
         for line in lines:
-            line_upper = line.strip().upper()
-            
             # Check if this line starts a new section
-            found_section = False
-            for section_key, section_name in sections.items():
-                if line_upper.startswith(section_key) or line_upper.startswith(section_key.replace("-", " ")):
-                    # Save previous section
-                    if current_section:
-                        insights[current_section] = "\n".join(current_content).strip()
-                    # Start new section
-                    current_section = section_name
-                    current_content = []
-                    found_section = True
-                    break
+            match = self._SECTION_RE.match(line.strip())
+            if match:
+                # Save previous section
+                if current_section:
+                    insights[current_section] = "\n".join(current_content).strip()
+                # Start new section
+                current_section = match.lastgroup
+                current_content = []
+                continue
             
-            if not found_section and current_section:
+            if current_section:
                 # Add line to current section (skip section headers)
                 if line.strip() and not line.strip().startswith("---"):
                     current_content.append(line)
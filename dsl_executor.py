@@ -63,10 +63,11 @@ Example script:
 from __future__ import annotations
 
 import os
+import re
 import shlex
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Final, List, Optional
 
 from file_manager import (
     list_files_in_folder,
@@ -79,6 +80,17 @@ from file_manager import (
 )
 
 
+# Quotes, escapes, and whitespace other than ASCII spaces and tabs. shlex
+# splits only on " \t\r\n" while str.split() also splits on Unicode
+# whitespace such as U+00A0, so such lines must go through shlex.
+_SHLEX_SPECIAL: Final = re.compile(r"[\"'\\]|[^\S \t]")
+
+
+def _needs_shlex(line: str) -> bool:
+    """Return True if a line must be split by shlex rather than str.split()."""
+    return _SHLEX_SPECIAL.search(line) is not None
+
+
 @dataclass
 class ExecutionResult:
     """Holds the outcome of executing a single DSL line."""
@@ -89,6 +101,95 @@ class ExecutionResult:
     success: bool
     result: Optional[object] = None
     error: Optional[Exception] = None
+    args: List[str] = field(default_factory=list)
+
+
+# Command handlers -----------------------------------------------------
+
+def _resolve(path: str, base_dir: Optional[Path]) -> str:
+    """Resolve a relative path argument against the script's base directory."""
+    if base_dir is None or os.path.isabs(path):
+        return path
+    return str(base_dir / path)
+
+
+def _require_args(args: List[str], expected: int, name: str) -> None:
+    if len(args) != expected:
+        raise ValueError(f"{name} expects {expected} argument(s), got {len(args)}")
+
+
+def _cmd_list_files(args: List[str], base_dir: Optional[Path]) -> str:
+    _require_args(args, 1, "LIST_FILES")
+    folder_path = _resolve(args[0], base_dir)
+    folder = Path(folder_path).resolve()
+    files = list_files_in_folder(folder_path)
+    return f"Folder: {folder}\nFiles: {files}"
+
+
+def _cmd_get_file_name(args: List[str], base_dir: Optional[Path]) -> str:
+    _require_args(args, 1, "GET_FILE_NAME")
+    file_path = _resolve(args[0], base_dir)
+    return get_file_name(file_path)
+
+
+def _cmd_get_file_size(args: List[str], base_dir: Optional[Path]) -> int:
+    _require_args(args, 1, "GET_FILE_SIZE")
+    file_path = _resolve(args[0], base_dir)
+    return get_file_size(file_path)
+
+
+def _cmd_rename_file(args: List[str], base_dir: Optional[Path]):
+    _require_args(args, 2, "RENAME_FILE")
+    file_path, new_name = args
+    return rename_file(_resolve(file_path, base_dir), new_name)
+
+
+def _cmd_create_folder(args: List[str], base_dir: Optional[Path]):
+    _require_args(args, 1, "CREATE_FOLDER")
+    folder_path = _resolve(args[0], base_dir)
+    return create_folder(folder_path, exist_ok=True)
+
+
+def _cmd_rename_folder(args: List[str], base_dir: Optional[Path]):
+    _require_args(args, 2, "RENAME_FOLDER")
+    folder_path, new_name = args
+    return rename_folder(_resolve(folder_path, base_dir), new_name)
+
+
+def _cmd_move_file(args: List[str], base_dir: Optional[Path]):
+    if len(args) not in (2, 3):
+        raise ValueError(
+            "MOVE_FILE expects 2 or 3 arguments: "
+            "<source_path> <destination_path> [OVERWRITE]"
+        )
+    source_path = _resolve(args[0], base_dir)
+    destination_path = _resolve(args[1], base_dir)
+    overwrite = False
+    if len(args) == 3:
+        # Compare as written first; upper() only for non-canonical flags
+        flag = args[2]
+        if flag == "OVERWRITE" or flag.upper() == "OVERWRITE":
+            overwrite = True
+        else:
+            raise ValueError(
+                "MOVE_FILE third argument must be OVERWRITE if provided."
+            )
+    return move_file(source_path, destination_path, overwrite=overwrite)
+
+
+# Command name -> handler taking the command's argument tokens. Built once
+# at import rather than per executor instance.
+_COMMAND_TABLE: Final[
+    Dict[str, Callable[[List[str], Optional[Path]], object]]
+] = {
+    "LIST_FILES": _cmd_list_files,
+    "GET_FILE_NAME": _cmd_get_file_name,
+    "GET_FILE_SIZE": _cmd_get_file_size,
+    "RENAME_FILE": _cmd_rename_file,
+    "CREATE_FOLDER": _cmd_create_folder,
+    "RENAME_FOLDER": _cmd_rename_folder,
+    "MOVE_FILE": _cmd_move_file,
+}
 
 
 class DSLExecutor:
@@ -102,34 +203,34 @@ class DSLExecutor:
             print(res)
     """
 
+    __slots__ = ("echo",)
+
     def __init__(self, echo: bool = True) -> None:
         """
         Args:
             echo: If True, print results and errors as commands execute.
         """
         self.echo = echo
-        self._command_table: dict[str, Callable[[List[str]], object]] = {
-            "LIST_FILES": self._cmd_list_files,
-            "GET_FILE_NAME": self._cmd_get_file_name,
-            "GET_FILE_SIZE": self._cmd_get_file_size,
-            "RENAME_FILE": self._cmd_rename_file,
-            "CREATE_FOLDER": self._cmd_create_folder,
-            "RENAME_FOLDER": self._cmd_rename_folder,
-            "MOVE_FILE": self._cmd_move_file,
-        }
 
     # Public API -----------------------------------------------------
 
-    def run_script_text(self, script: str) -> List[ExecutionResult]:
+    def run_script_text(
+        self, script: str, base_dir: Optional[str | Path] = None
+    ) -> List[ExecutionResult]:
         """
         Execute DSL commands from a string containing the script.
 
         Args:
             script: Entire DSL script as a string.
+            base_dir: Directory that relative paths in the script resolve
+                against. Defaults to the current working directory.
 
         Returns:
             List of ExecutionResult, one for each non-empty, non-comment line.
         """
+        if base_dir is not None:
+            base_dir = Path(base_dir)
+
         results: List[ExecutionResult] = []
         for index, raw_line in enumerate(script.splitlines(), start=1):
             line = raw_line.strip()
@@ -138,7 +239,12 @@ class DSLExecutor:
                 continue
 
             try:
-                tokens = shlex.split(line)
+                if _needs_shlex(line):
+                    tokens = shlex.split(line)
+                else:
+                    # Nothing to unquote or unescape; plain splitting is
+                    # equivalent and much cheaper
+                    tokens = line.split()
             except ValueError as e:
                 result = ExecutionResult(
                     line_number=index,
@@ -156,10 +262,14 @@ class DSLExecutor:
             if not tokens:
                 continue
 
-            command = tokens[0].upper()
+            command = tokens[0]
             args = tokens[1:]
 
-            handler = self._command_table.get(command)
+            # Scripts normally use canonical upper-case commands already
+            handler = _COMMAND_TABLE.get(command)
+            if handler is None:
+                command = command.upper()
+                handler = _COMMAND_TABLE.get(command)
             if handler is None:
                 err = ValueError(f"Unknown command: {command}")
                 result = ExecutionResult(
@@ -169,6 +279,7 @@ class DSLExecutor:
                     success=False,
                     result=None,
                     error=err,
+                    args=args,
                 )
                 results.append(result)
                 if self.echo:
@@ -176,7 +287,7 @@ class DSLExecutor:
                 continue
 
             try:
-                value = handler(args)
+                value = handler(args, base_dir)
                 result = ExecutionResult(
                     line_number=index,
                     line=raw_line,
@@ -184,6 +295,7 @@ class DSLExecutor:
                     success=True,
                     result=value,
                     error=None,
+                    args=args,
                 )
                 results.append(result)
                 if self.echo:
@@ -196,6 +308,7 @@ class DSLExecutor:
                     success=False,
                     result=None,
                     error=e,
+                    args=args,
                 )
                 results.append(result)
                 if self.echo:
@@ -221,71 +334,9 @@ class DSLExecutor:
         path = Path(script_path).resolve()
         text = path.read_text(encoding="utf-8")
 
-        original_cwd = os.getcwd()
-        try:
-            # Make all relative paths inside the script resolve from the
-            # script's directory for a more intuitive authoring experience.
-            os.chdir(str(path.parent))
-            return self.run_script_text(text)
-        finally:
-            os.chdir(original_cwd)
-
-    # Command handlers -----------------------------------------------
-
-    def _require_args(self, args: List[str], expected: int, name: str) -> None:
-        if len(args) != expected:
-            raise ValueError(f"{name} expects {expected} argument(s), got {len(args)}")
-
-    def _cmd_list_files(self, args: List[str]) -> str:
-        self._require_args(args, 1, "LIST_FILES")
-        folder_path = args[0]
-        folder = Path(folder_path).resolve()
-        files = list_files_in_folder(folder_path)
-        return f"Folder: {folder}\nFiles: {files}"
-
-    def _cmd_get_file_name(self, args: List[str]) -> str:
-        self._require_args(args, 1, "GET_FILE_NAME")
-        file_path = args[0]
-        return get_file_name(file_path)
-
-    def _cmd_get_file_size(self, args: List[str]) -> int:
-        self._require_args(args, 1, "GET_FILE_SIZE")
-        file_path = args[0]
-        return get_file_size(file_path)
-
-    def _cmd_rename_file(self, args: List[str]):
-        self._require_args(args, 2, "RENAME_FILE")
-        file_path, new_name = args
-        return rename_file(file_path, new_name)
-
-    def _cmd_create_folder(self, args: List[str]):
-        self._require_args(args, 1, "CREATE_FOLDER")
-        folder_path = args[0]
-        return create_folder(folder_path, exist_ok=True)
-
-    def _cmd_rename_folder(self, args: List[str]):
-        self._require_args(args, 2, "RENAME_FOLDER")
-        folder_path, new_name = args
-        return rename_folder(folder_path, new_name)
-
-    def _cmd_move_file(self, args: List[str]):
-        if len(args) not in (2, 3):
-            raise ValueError(
-                "MOVE_FILE expects 2 or 3 arguments: "
-                "<source_path> <destination_path> [OVERWRITE]"
-            )
-        source_path = args[0]
-        destination_path = args[1]
-        overwrite = False
-        if len(args) == 3:
-            flag = args[2].upper()
-            if flag == "OVERWRITE":
-                overwrite = True
-            else:
-                raise ValueError(
-                    "MOVE_FILE third argument must be OVERWRITE if provided."
-                )
-        return move_file(source_path, destination_path, overwrite=overwrite)
+        # Resolve relative paths from the script's directory explicitly
+        # rather than changing the process-wide working directory
+        return self.run_script_text(text, base_dir=path.parent)
 
 
 def main() -> None:
@@ -7,10 +7,107 @@ input and output parameters.
 
 from __future__ import annotations
 
+import ctypes
+import errno
 import os
 import shutil
+import stat
+import sys
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional
+
+
+# statx(2) constants from <linux/stat.h> and <fcntl.h>
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_SIZE = 0x0200
+
+
+class _Statx(ctypes.Structure):
+    """Leading fields of struct statx; the kernel writes 256 bytes."""
+
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("_rest", ctypes.c_uint8 * 208),
+    ]
+
+
+def _load_statx() -> Optional[Callable]:
+    """Return libc's statx() on Linux, or None where it is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        statx = libc.statx
+    except (OSError, AttributeError):
+        return None
+    statx.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_uint,
+        ctypes.POINTER(_Statx),
+    ]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+_statx = _load_statx()
+
+
+def _fast_size(path: str | os.PathLike) -> Optional[int]:
+    """
+    Size of a regular file via statx(), asking only for type and size.
+
+    AT_STATX_DONT_SYNC lets network filesystems answer from cached
+    attributes instead of revalidating with the server.
+
+    Returns:
+        The size in bytes, or None if statx() is unavailable, fails, or the
+        path is not a regular file, so callers can fall back to os.stat().
+    """
+    global _statx
+    if _statx is None:
+        return None
+
+    buf = _Statx()
+    if _statx(
+        _AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC,
+        _STATX_TYPE | _STATX_SIZE, ctypes.byref(buf),
+    ) != 0:
+        if ctypes.get_errno() == errno.ENOSYS:
+            _statx = None  # Kernel older than 4.11
+        return None
+    if not stat.S_ISREG(buf.stx_mode) or not buf.stx_mask & _STATX_SIZE:
+        return None
+    return buf.stx_size
+
+
+# Characters that make a "new name" a path rather than a bare name
+_SEPARATORS = frozenset(c for c in (os.path.sep, os.path.altsep) if c)
+
+
+def _has_sep(name: str) -> bool:
+    """Return True if name contains a path separator."""
+    return not _SEPARATORS.isdisjoint(name)
+
+
+def _stat_or_none(path: str | os.PathLike) -> Optional[os.stat_result]:
+    """Stat a path (following symlinks), or return None if it does not exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
 def list_files_in_folder(folder_path: str | os.PathLike) -> List[str]:
@@ -28,14 +125,18 @@ def list_files_in_folder(folder_path: str | os.PathLike) -> List[str]:
         NotADirectoryError: If the provided path is not a directory.
         PermissionError: If the folder cannot be accessed.
     """
-    folder = Path(folder_path)
+    # scandir reports each entry's type from the directory listing itself,
+    # so regular files need no extra stat call, and its own errors replace
+    # separate existence and directory checks
+    try:
+        entries = os.scandir(os.fspath(folder_path))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Folder does not exist: {Path(folder_path)}") from None
+    except NotADirectoryError:
+        raise NotADirectoryError(f"Path is not a directory: {Path(folder_path)}") from None
 
-    if not folder.exists():
-        raise FileNotFoundError(f"Folder does not exist: {folder}")
-    if not folder.is_dir():
-        raise NotADirectoryError(f"Path is not a directory: {folder}")
-
-    return [entry.name for entry in folder.iterdir() if entry.is_file()]
+    with entries:
+        return [entry.name for entry in entries if entry.is_file()]
 
 
 def get_file_name(file_path: str | os.PathLike) -> str:
@@ -71,12 +172,17 @@ def get_file_size(file_path: str | os.PathLike) -> int:
         FileNotFoundError: If the file does not exist.
         PermissionError: If the file cannot be accessed.
     """
+    size = _fast_size(file_path)
+    if size is not None:
+        return size
+
     path = Path(file_path)
-    if not path.exists():
+    st = _stat_or_none(path)
+    if st is None:
         raise FileNotFoundError(f"File does not exist: {path}")
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise IsADirectoryError(f"Path is not a file: {path}")
-    return path.stat().st_size
+    return st.st_size
 
 
 def rename_file(file_path: str | os.PathLike, new_name: str) -> Path:
@@ -96,18 +202,21 @@ def rename_file(file_path: str | os.PathLike, new_name: str) -> Path:
         PermissionError: If the operation is not permitted.
         ValueError: If new_name contains path separators.
     """
-    if os.path.sep in new_name or (os.path.altsep and os.path.altsep in new_name):
+    if _has_sep(new_name):
         raise ValueError("new_name must be a name only, not a full path.")
 
     src = Path(file_path)
-    if not src.exists():
+    src_stat = _stat_or_none(src)
+    if src_stat is None:
         raise FileNotFoundError(f"File does not exist: {src}")
-    if not src.is_file():
+    if not stat.S_ISREG(src_stat.st_mode):
         raise IsADirectoryError(f"Path is not a file: {src}")
 
     dest = src.with_name(new_name)
 
-    if dest.exists():
+    # rename() silently replaces an existing file on POSIX, so this check
+    # cannot be left to the operation itself
+    if _stat_or_none(dest) is not None:
         raise FileExistsError(f"Target file already exists: {dest}")
 
     src.rename(dest)
@@ -131,10 +240,14 @@ def create_folder(folder_path: str | os.PathLike, exist_ok: bool = True) -> Path
     """
     path = Path(folder_path)
 
-    if path.exists() and not path.is_dir():
-        raise FileExistsError(f"Non-directory already exists at path: {path}")
-
-    path.mkdir(parents=True, exist_ok=exist_ok)
+    try:
+        path.mkdir(parents=True, exist_ok=exist_ok)
+    except FileExistsError:
+        if not path.is_dir():
+            raise FileExistsError(
+                f"Non-directory already exists at path: {path}"
+            ) from None
+        raise
     return path
 
 
@@ -156,17 +269,18 @@ def rename_folder(folder_path: str | os.PathLike, new_name: str) -> Path:
         PermissionError: If the operation is not permitted.
         ValueError: If new_name contains path separators.
     """
-    if os.path.sep in new_name or (os.path.altsep and os.path.altsep in new_name):
+    if _has_sep(new_name):
         raise ValueError("new_name must be a name only, not a full path.")
 
     src = Path(folder_path)
-    if not src.exists():
+    src_stat = _stat_or_none(src)
+    if src_stat is None:
         raise FileNotFoundError(f"Folder does not exist: {src}")
-    if not src.is_dir():
+    if not stat.S_ISDIR(src_stat.st_mode):
         raise NotADirectoryError(f"Path is not a directory: {src}")
 
     dest = src.with_name(new_name)
-    if dest.exists():
+    if _stat_or_none(dest) is not None:
         raise FileExistsError(f"Target folder already exists: {dest}")
 
     src.rename(dest)
@@ -198,22 +312,38 @@ def move_file(
     src = Path(source_path)
     dest = Path(destination_path)
 
-    if not src.exists():
+    # One stat per path; its mode answers both "exists" and "what type"
+    src_stat = _stat_or_none(src)
+    if src_stat is None:
         raise FileNotFoundError(f"Source file does not exist: {src}")
-    if not src.is_file():
+    if not stat.S_ISREG(src_stat.st_mode):
         raise IsADirectoryError(f"Source path is not a file: {src}")
 
     # If destination is a directory, move the file into it keeping the same name.
-    if dest.exists() and dest.is_dir():
+    dest_stat = _stat_or_none(dest)
+    if dest_stat is not None and stat.S_ISDIR(dest_stat.st_mode):
         dest = dest / src.name
-
-    if dest.exists():
-        if not overwrite:
-            raise FileExistsError(f"Destination file already exists: {dest}")
-        # If overwriting, remove the existing file first to avoid issues on Windows.
-        if dest.is_file():
-            dest.unlink()
-
+        dest_stat = _stat_or_none(dest)
+
+    if dest_stat is not None and not overwrite:
+        raise FileExistsError(f"Destination file already exists: {dest}")
+
+    # On the same filesystem a move is a single rename; os.replace also
+    # overwrites atomically on Windows. shutil.move is kept for moves across
+    # devices and for the rare case where the target name is a directory.
+    if dest_stat is None or not stat.S_ISDIR(dest_stat.st_mode):
+        try:
+            try:
+                os.replace(src, dest)
+            except FileNotFoundError:
+                # Source was stat'ed above, so the destination folder is
+                # missing; create it only now instead of before every move
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(src, dest)
+            return dest
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
     dest.parent.mkdir(parents=True, exist_ok=True)
     shutil.move(str(src), str(dest))
     return dest
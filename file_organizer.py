@@ -6,45 +6,54 @@ for organizing files based on their type or content.
 from __future__ import annotations
 
 import os
+import re
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict
-
-# Try to load .env file using python-dotenv
-try:
-    from dotenv import load_dotenv
-    load_dotenv()  # Load environment variables from .env file
-except ImportError:
-    # If python-dotenv is not installed, manually load .env file
-    def load_env_manually():
-        """Manually load .env file if python-dotenv is not available."""
-        env_file = Path(".env")
-        if env_file.exists():
-            try:
-                # Use utf-8-sig to handle BOM (Byte Order Mark)
-                with open(env_file, "r", encoding="utf-8-sig") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#") and "=" in line:
-                            key, value = line.split("=", 1)
-                            # Strip BOM and whitespace from key
-                            key = key.strip().lstrip("\ufeff")
-                            os.environ[key] = value.strip()
-            except Exception:
-                pass  # Silently fail if can't read .env file
-    
-    load_env_manually()
-
-from file_manager import (
-    list_files_in_folder,
-    get_file_name,
-    get_file_size,
-)
-from dsl_executor import DSLExecutor
+from typing import Callable, Dict, Final, List, Optional
 
+# KEY=value lines of a .env file; comment lines never match
+_ENV_ASSIGNMENT = re.compile(r"^[ \t]*([^#=\s][^=\n]*)=(.*)$", re.MULTILINE)
+_ENV_LOADED = False
 
-def get_dsl_specification() -> str:
-    """Returns the DSL specification documentation."""
-    return """
+
+def _load_env_once() -> None:
+    """
+    Load variables from .env into the environment, once per process.
+
+    Uses python-dotenv when it is installed; otherwise the file is read in
+    one go and parsed with a single regex pass. Like python-dotenv, values
+    already set in the environment are kept.
+    """
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        try:
+            # utf-8-sig drops a leading BOM (Byte Order Mark)
+            data = Path(".env").read_bytes().decode("utf-8-sig")
+        except (OSError, UnicodeDecodeError):
+            return  # Silently continue if the .env file can't be read
+        for match in _ENV_ASSIGNMENT.finditer(data):
+            os.environ.setdefault(match.group(1).strip(), match.group(2).strip())
+    else:
+        load_dotenv()  # Load environment variables from .env file
+
+
+_load_env_once()
+
+from dsl_executor import DSLExecutor, ExecutionResult
+
+# (threshold, unit) pairs for human-readable sizes, largest first; a size
+# strictly above the threshold is shown in that unit
+_SIZE_UNITS: Final = ((1 << 20, "MB"), (1 << 10, "KB"))
+
+
+# DSL specification sent to the model with every organization request
+_DSL_SPEC: Final[str] = """
 The DSL is a line-oriented language for file management operations.
 
 Lines:
@@ -86,6 +95,43 @@ Important notes:
 """
 
 
+def get_dsl_specification() -> str:
+    """Returns the DSL specification documentation."""
+    return _DSL_SPEC
+
+
+# User prompt for call_openai_api(), filled in with str.format()
+_PROMPT_TEMPLATE: Final[str] = """You are a file organization assistant. Given a list of files in a folder, generate DSL code to organize them into subfolders based on their file types or content.
+
+Base folder path: {folder_path}
+Base folder name: {folder_name}
+Number of files: {file_count}
+
+Files in the folder:
+{files_info}
+
+DSL Specification:
+{dsl_spec}
+
+Instructions:
+1. Analyze the files and group them by file extension or content type (e.g., images, documents, videos, text files, etc.)
+2. Create appropriate subfolders for each category
+3. Move files into their corresponding folders using MOVE_FILE commands
+4. Use relative paths (relative to the base folder: "{folder_name}")
+5. Use forward slashes (/) in all paths
+6. Include OVERWRITE flag when moving files to avoid errors
+7. Add comments to explain the organization strategy
+8. Only output valid DSL code, no explanations or markdown formatting
+
+Generate the DSL code now:"""
+
+
+def _file_extension(file_name: str) -> str:
+    """Lower-cased extension of a file name, matching Path.suffix."""
+    ext = os.path.splitext(file_name)[1]
+    return "" if ext == "." else ext.lower()
+
+
 def analyze_folder(base_folder: str) -> Dict:
     """
     Analyzes a folder and returns detailed information about all files.
@@ -98,32 +144,41 @@ def analyze_folder(base_folder: str) -> Dict:
     """
     base_path = Path(base_folder).resolve()
 
-    if not base_path.exists():
-        raise FileNotFoundError(f"Folder does not exist: {base_path}")
-    if not base_path.is_dir():
-        raise NotADirectoryError(f"Path is not a directory: {base_path}")
-
-    files = list_files_in_folder(base_folder)
+    # Let scandir report a missing folder or non-directory itself rather
+    # than stat-ing the path twice up front
+    try:
+        entries = os.scandir(base_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Folder does not exist: {base_path}") from None
+    except NotADirectoryError:
+        raise NotADirectoryError(f"Path is not a directory: {base_path}") from None
+
+    # One directory pass: DirEntry caches the file type, so each file
+    # costs a single stat() for its size
     file_details = []
-
-    for file_name in files:
-        file_path = base_path / file_name
-        try:
-            size = get_file_size(str(file_path))
-            file_info = {
-                "name": file_name,
-                "size_bytes": size,
-                "extension": file_path.suffix.lower(),
-            }
-            file_details.append(file_info)
-        except Exception as e:
-            # If we can't get file info, still include the name
-            file_info = {
-                "name": file_name,
-                "size_bytes": None,
-                "extension": file_path.suffix.lower(),
-                "error": str(e),
-            }
+    with entries:
+        for entry in entries:
+            try:
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            file_name = entry.name
+            extension = _file_extension(file_name)
+            try:
+                file_info = {
+                    "name": file_name,
+                    "size_bytes": entry.stat().st_size,
+                    "extension": extension,
+                }
+            except OSError as e:
+                # If we can't get file info, still include the name
+                file_info = {
+                    "name": file_name,
+                    "size_bytes": None,
+                    "extension": extension,
+                    "error": str(e),
+                }
             file_details.append(file_info)
 
     return {
@@ -144,7 +199,7 @@ def generate_summary(analysis: Dict) -> str:
     Returns:
         Formatted string summary.
     """
-    summary = f"""
+    parts = [f"""
 === Folder Analysis Summary ===
 
 Base Folder: {analysis['folder_path']}
@@ -152,38 +207,109 @@ Folder Name: {analysis['folder_name']}
 Total Files: {analysis['file_count']}
 
 Files:
-"""
+"""]
+    # Count extensions in the same pass that lists the files
+    ext_counts: Counter = Counter()
     for file_info in analysis["files"]:
         name = file_info["name"]
         size = file_info.get("size_bytes")
         ext = file_info.get("extension", "")
         
         if size is not None:
-            size_str = f"{size:,} bytes"
-            if size > 1024 * 1024:
-                size_str += f" ({size / (1024 * 1024):.2f} MB)"
-            elif size > 1024:
-                size_str += f" ({size / 1024:.2f} KB)"
+            for threshold, unit in _SIZE_UNITS:
+                if size > threshold:
+                    size_str = f"{size:,} bytes ({size / threshold:.2f} {unit})"
+                    break
+            else:
+                size_str = f"{size:,} bytes"
         else:
             size_str = "unknown size"
         
-        summary += f"  - {name} ({size_str}) [Extension: {ext or 'none'}]\n"
-
-    # Group by extension for overview
-    ext_counts: Dict[str, int] = {}
-    for file_info in analysis["files"]:
-        ext = file_info.get("extension", "").lower() or "no_extension"
-        ext_counts[ext] = ext_counts.get(ext, 0) + 1
+        parts.append(f"  - {name} ({size_str}) [Extension: {ext or 'none'}]\n")
+        ext_counts[ext.lower() or "no_extension"] += 1
 
-    summary += "\nFile Types (by extension):\n"
+    parts.append("\nFile Types (by extension):\n")
     for ext, count in sorted(ext_counts.items()):
         ext_display = ext if ext else "(no extension)"
-        summary += f"  - {ext_display}: {count} file(s)\n"
+        parts.append(f"  - {ext_display}: {count} file(s)\n")
 
-    return summary
+    return "".join(parts)
 
 
-def call_openai_api(api_key: str, folder_analysis: Dict, dsl_spec: str) -> str:
+def _strip_code_fences(text: str) -> str:
+    """Strips surrounding whitespace and a Markdown code block from a completion."""
+    text = text.strip()
+    if text.startswith("```"):
+        lines = text.split("\n")
+        # Remove first line (```dsl or ```)
+        lines = lines[1:]
+        # Remove last line if it's ```
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        text = "\n".join(lines)
+    return text
+
+
+class _FencedCodeEcho:
+    """
+    Incrementally strips a Markdown code block from a streamed completion.
+
+    feed() returns the part of the code that later text cannot change, and
+    finish() the rest, so together they equal _strip_code_fences() of the
+    whole completion. Only the unsettled tail (the last line with content
+    and any whitespace after it) is kept, so each delta costs time in
+    proportion to that tail rather than to the whole response.
+    """
+
+    def __init__(self) -> None:
+        self._pending = ""
+        self._started = False  # Leading whitespace has been skipped
+        self._fenced: Optional[bool] = None  # Undecided until the first line ends
+
+    def feed(self, delta: str) -> str:
+        """Add a streamed piece and return the newly settled code."""
+        self._pending += delta
+        if not self._started:
+            self._pending = self._pending.lstrip()
+            self._started = bool(self._pending)
+        if self._fenced is None:
+            end = self._pending.find("\n")
+            if end < 0:
+                return ""
+            self._fenced = self._pending.startswith("```")
+            if self._fenced:
+                self._pending = self._pending[end + 1:]
+        if "\n" not in delta:
+            return ""
+
+        # Everything before the newline that precedes the last line with
+        # content is settled; that newline is dropped if the line turns out
+        # to be the closing fence
+        cut = self._pending.rstrip().rfind("\n")
+        if cut <= 0:
+            return ""
+        settled, self._pending = self._pending[:cut], self._pending[cut:]
+        return settled
+
+    def finish(self) -> str:
+        """Return the remaining code once the stream has ended."""
+        tail = self._pending.rstrip()
+        if self._fenced is None:
+            # The completion was a single line
+            return "" if tail.startswith("```") else tail
+        if self._fenced:
+            last_newline = tail.rfind("\n")
+            if tail[last_newline + 1:].strip() == "```":
+                return tail[:max(last_newline, 0)]
+        return tail
+
+
+def call_openai_api(
+    api_key: str,
+    folder_analysis: Dict,
+    dsl_spec: str,
+    on_text: Optional[Callable[[str], None]] = None,
+) -> str:
     """
     Calls OpenAI API to generate DSL code for organizing files.
 
@@ -191,6 +317,9 @@ def call_openai_api(api_key: str, folder_analysis: Dict, dsl_spec: str) -> str:
         api_key: OpenAI API key.
         folder_analysis: Dictionary from analyze_folder().
         dsl_spec: DSL specification documentation.
+        on_text: Optional callback invoked with successive pieces of the
+            DSL code as the response is streamed. The pieces exclude any
+            Markdown code fence and together equal the returned code.
 
     Returns:
         Generated DSL code as a string.
@@ -210,32 +339,16 @@ def call_openai_api(api_key: str, folder_analysis: Dict, dsl_spec: str) -> str:
         for f in folder_analysis["files"]
     ])
 
-    prompt = f"""You are a file organization assistant. Given a list of files in a folder, generate DSL code to organize them into subfolders based on their file types or content.
-
-Base folder path: {folder_analysis['folder_path']}
-Base folder name: {folder_analysis['folder_name']}
-Number of files: {folder_analysis['file_count']}
-
-Files in the folder:
-{files_info}
-
-DSL Specification:
-{dsl_spec}
-
-Instructions:
-1. Analyze the files and group them by file extension or content type (e.g., images, documents, videos, text files, etc.)
-2. Create appropriate subfolders for each category
-3. Move files into their corresponding folders using MOVE_FILE commands
-4. Use relative paths (relative to the base folder: "{folder_analysis['folder_name']}")
-5. Use forward slashes (/) in all paths
-6. Include OVERWRITE flag when moving files to avoid errors
-7. Add comments to explain the organization strategy
-8. Only output valid DSL code, no explanations or markdown formatting
-
-Generate the DSL code now:"""
+    prompt = _PROMPT_TEMPLATE.format(
+        folder_path=folder_analysis["folder_path"],
+        folder_name=folder_analysis["folder_name"],
+        file_count=folder_analysis["file_count"],
+        files_info=files_info,
+        dsl_spec=dsl_spec,
+    )
 
     try:
-        response = client.chat.completions.create(
+        stream = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {
@@ -245,20 +358,26 @@ Generate the DSL code now:"""
                 {"role": "user", "content": prompt},
             ],
             temperature=0.3,
+            stream=True,
         )
 
-        dsl_code = response.choices[0].message.content.strip()
-
-        # Remove markdown code blocks if present
-        if dsl_code.startswith("```"):
-            lines = dsl_code.split("\n")
-            # Remove first line (```dsl or ```)
-            if lines[0].startswith("```"):
-                lines = lines[1:]
-            # Remove last line if it's ```
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            dsl_code = "\n".join(lines)
+        pieces = []
+        echo = _FencedCodeEcho()
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                pieces.append(delta)
+                if on_text is not None:
+                    settled = echo.feed(delta)
+                    if settled:
+                        on_text(settled)
+        dsl_code = _strip_code_fences("".join(pieces))
+        if on_text is not None:
+            rest = echo.finish()
+            if rest:
+                on_text(rest)
 
         return dsl_code
 
@@ -266,6 +385,45 @@ Generate the DSL code now:"""
         raise RuntimeError(f"Error calling OpenAI API: {e}")
 
 
+def _analysis_after_run(
+    analysis: Dict, results: List[ExecutionResult]
+) -> Optional[Dict]:
+    """
+    Derives the folder analysis after a DSL run from the commands' results.
+
+    Only MOVE_FILE and RENAME_FILE change which files sit directly in the
+    folder, so their successful results are replayed on the analysis taken
+    before the run instead of re-scanning the folder.
+
+    Args:
+        analysis: Dictionary returned from analyze_folder() before the run.
+        results: Results of executing the DSL with the folder as working
+            directory.
+
+    Returns:
+        Updated analysis dictionary, or None if a file was moved into the
+        folder from elsewhere and its details are unknown.
+    """
+    base = analysis["folder_path"]
+    files = {info["name"]: info for info in analysis["files"]}
+    for result in results:
+        if not result.success or result.command not in ("MOVE_FILE", "RENAME_FILE"):
+            continue
+        src = os.path.abspath(result.args[0])
+        dest = os.path.abspath(result.result)
+        info = None
+        if os.path.dirname(src) == base:
+            info = files.pop(os.path.basename(src), None)
+        if os.path.dirname(dest) != base:
+            continue
+        if info is None:
+            return None
+        name = os.path.basename(dest)
+        files[name] = dict(info, name=name, extension=_file_extension(name))
+
+    return dict(analysis, file_count=len(files), files=list(files.values()))
+
+
 def main() -> None:
     """Main program entry point."""
     print("=" * 60)
@@ -313,29 +471,7 @@ def main() -> None:
         return
 
     # Step 3: Call OpenAI API
-    # Try to load from .env file again (in case it wasn't loaded at startup)
-    env_file = Path(".env")
-    if env_file.exists() and not os.getenv("OPENAI_API_KEY"):
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-        except ImportError:
-            # Manual load
-            try:
-                # Use utf-8-sig to handle BOM (Byte Order Mark)
-                with open(env_file, "r", encoding="utf-8-sig") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#") and "=" in line:
-                            key, value = line.split("=", 1)
-                            # Strip BOM and whitespace from key
-                            key = key.strip().lstrip("\ufeff")
-                            if key == "OPENAI_API_KEY":
-                                os.environ["OPENAI_API_KEY"] = value.strip()
-                                break
-            except Exception:
-                pass
-    
+    _load_env_once()
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         print("\nError: OPENAI_API_KEY not found.")
@@ -346,13 +482,19 @@ def main() -> None:
     print("\nCalling OpenAI API to generate organization DSL code...")
     try:
         dsl_spec = get_dsl_specification()
-        dsl_code = call_openai_api(api_key, analysis, dsl_spec)
         print("\nGenerated DSL code:")
         print("=" * 60)
-        print(dsl_code)
+        # Show the DSL as it is generated instead of after the last token
+        dsl_code = call_openai_api(
+            api_key,
+            analysis,
+            dsl_spec,
+            on_text=lambda text: print(text, end="", flush=True),
+        )
+        print()
         print("=" * 60)
     except Exception as e:
-        print(f"Error generating DSL code: {e}")
+        print(f"\nError generating DSL code: {e}")
         return
 
     # Step 4: Confirm execution
@@ -387,7 +529,9 @@ def main() -> None:
         # Show final state
         print("\nFinal folder state:")
         print("-" * 60)
-        final_analysis = analyze_folder(".")
+        final_analysis = _analysis_after_run(analysis, results)
+        if final_analysis is None:
+            final_analysis = analyze_folder(".")
         final_summary = generate_summary(final_analysis)
         print(final_summary)
 
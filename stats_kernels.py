@@ -0,0 +1,77 @@
+"""
+Compiled statistics kernels for CSV analysis.
+
+This module requires Numba. Importing it raises ImportError when Numba is
+not installed, so callers can fall back to their pandas implementation.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+# fastmath is deliberately off: it lets LLVM assume values are never NaN,
+# which would break the null counting below. The kernel is compiled on its
+# first call (or loaded from the on-disk cache), so runs that never need it
+# do not pay for JIT compilation.
+@njit(parallel=True, cache=True)
+def column_stats(X: np.ndarray) -> np.ndarray:
+    """
+    Compute per-column statistics of a 2D float array in a single pass.
+
+    Columns are processed in parallel; within a column, the mean and the
+    sum of squared deviations use Welford's online algorithm over the
+    finite values. NaNs are treated as missing values. Infinities count
+    towards the count, min and max only, so callers can derive pandas'
+    inf/NaN mean and standard deviation from the result.
+
+    Args:
+        X: 2D float64 array, ideally Fortran-ordered so columns are contiguous.
+
+    Returns:
+        Array of shape (n_columns, 6) holding the non-null count, the finite
+        count, the mean and sum of squared deviations of the finite values,
+        and the min and max per column. Statistics that are undefined
+        (e.g. for an all-null column) are NaN.
+    """
+    n_rows, n_cols = X.shape
+    out = np.empty((n_cols, 6))
+    for j in prange(n_cols):
+        count = 0
+        finite = 0
+        mean = 0.0
+        m2 = 0.0
+        lo = np.inf
+        hi = -np.inf
+        for i in range(n_rows):
+            value = X[i, j]
+            if math.isnan(value):
+                continue
+            count += 1
+            if value < lo:
+                lo = value
+            if value > hi:
+                hi = value
+            if math.isinf(value):
+                continue
+            finite += 1
+            delta = value - mean
+            mean += delta / finite
+            m2 += delta * (value - mean)
+
+        out[j, 0] = count
+        out[j, 1] = finite
+        if finite == 0:
+            out[j, 2:4] = np.nan
+        else:
+            out[j, 2] = mean
+            out[j, 3] = m2
+        if count == 0:
+            out[j, 4:] = np.nan
+        else:
+            out[j, 4] = lo
+            out[j, 5] = hi
+    return out
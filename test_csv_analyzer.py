@@ -0,0 +1,311 @@
+"""Tests for CSVAnalyzer's whole-file and streamed analysis.
+
+Run with:
+
+    python -m pytest test_csv_analyzer.py
+"""
+
+from __future__ import annotations
+
+import io
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import csv_analyzer
+from csv_analyzer import CSVAnalyzer
+
+HERE = Path(__file__).parent
+BUNDLED_CSVS = sorted(HERE.glob("*.csv"))
+
+# Small CSVs for the cases streaming has to special-case
+EDGE_CASES = {
+    "header_only": "a,b\n",
+    "bool": "flag,x\nTrue,1\nFalse,2\nFalse,3\n",
+    "all_null": "a,b,c\n1,,x\n2,,y\n",
+    "dates": "d,x\n2010-01-01,1\n2010-01-01,2\n2011-02-03,3\n",
+    "inf": "a,b\n1,1\ninf,2\n3,3\n-inf,4\n",
+    "positive_inf": "a,b\n1,1\ninf,2\n3,3\n",
+    "mixed": "a,b\n1,x\n2,y\nz,3\n",
+}
+
+# Fields that depend on how the data was read rather than on its content
+IGNORED_KEYS = ("file_path", "memory_usage_bytes")
+
+
+class _Unseekable(io.RawIOBase):
+    """Binary stream that cannot seek, like a network upload."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buffer = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        return self._buffer.readinto(b)
+
+
+def assert_same(expected, actual, path="result"):
+    """Compare analysis results, treating NaNs as equal and floats approximately."""
+    if isinstance(expected, dict):
+        assert isinstance(actual, dict), path
+        keys = set(expected) - set(IGNORED_KEYS)
+        assert keys == set(actual) - set(IGNORED_KEYS), path
+        for key in keys:
+            assert_same(expected[key], actual[key], f"{path}[{key!r}]")
+    elif isinstance(expected, (list, tuple)):
+        assert len(expected) == len(actual), path
+        for index, (x, y) in enumerate(zip(expected, actual)):
+            assert_same(x, y, f"{path}[{index}]")
+    elif isinstance(expected, float) and math.isnan(expected):
+        assert isinstance(actual, float) and math.isnan(actual), path
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-12), path
+    else:
+        assert type(actual) is type(expected) and actual == expected, path
+
+
+def analyze_both(path, chunksize):
+    """Analyze a CSV file by path and as seekable and unseekable streams."""
+    analyzer = CSVAnalyzer()
+    expected = analyzer.analyze_file(path)
+    data = path.read_bytes()
+    streams = (io.BytesIO(data), io.BufferedReader(_Unseekable(data)))
+    return expected, [
+        analyzer.analyze_fileobj(stream, path.name, chunksize=chunksize)
+        for stream in streams
+    ]
+
+
+@pytest.fixture(params=sorted(EDGE_CASES))
+def edge_csv(request, tmp_path):
+    path = tmp_path / f"{request.param}.csv"
+    path.write_text(EDGE_CASES[request.param])
+    return path
+
+
+@pytest.mark.parametrize("path", BUNDLED_CSVS, ids=lambda path: path.name)
+def test_bundled_csvs_match(path):
+    expected, streamed = analyze_both(path, chunksize=1000)
+    for actual in streamed:
+        assert_same(expected, actual)
+
+
+def test_edge_cases_match(edge_csv):
+    # Two-row chunks make every column's statistics span several chunks
+    expected, streamed = analyze_both(edge_csv, chunksize=2)
+    for actual in streamed:
+        assert_same(expected, actual)
+
+
+def test_non_utf8_is_a_read_error(tmp_path):
+    path = tmp_path / "latin1.csv"
+    path.write_bytes("name,value\ncafé,1\n".encode("latin-1"))
+
+    with pytest.raises(RuntimeError, match="utf-8"):
+        CSVAnalyzer().analyze_file(path)
+    with pytest.raises(RuntimeError, match="utf-8"):
+        CSVAnalyzer().analyze_fileobj(io.BytesIO(path.read_bytes()), path.name)
+
+
+def test_edge_case_values(tmp_path):
+    def analyze(name):
+        path = tmp_path / f"{name}.csv"
+        path.write_text(EDGE_CASES[name])
+        return CSVAnalyzer().analyze_file(path)
+
+    header_only = analyze("header_only")
+    assert header_only["file_summary"]["number_of_columns"] == 2
+    assert header_only["file_summary"]["number_of_rows"] == 0
+
+    flags = analyze("bool")["statistical_summary"]["statistics"]["non_numerical_columns"]
+    assert flags["flag"]["most_frequent"] == [False]
+    assert type(flags["flag"]["most_frequent"][0]) is bool
+
+    all_null = analyze("all_null")
+    assert all_null["file_summary"]["data_types"]["b"] == "float64"
+    assert "b" in all_null["statistical_summary"]["numerical_columns"]
+
+    dates = analyze("dates")
+    assert dates["file_summary"]["data_types"]["d"] == "str"
+
+    stats = analyze("positive_inf")["statistical_summary"]["statistics"]
+    assert stats["a"]["mean"] == math.inf
+    assert math.isnan(stats["a"]["std"])
+    assert math.isnan(analyze("inf")["statistical_summary"]["statistics"]["a"]["mean"])
+
+
+# Files PyArrow rejects or reads differently from pandas, so analyze_file()
+# must read them with pandas
+PANDAS_ONLY_CASES = {
+    "short_row": "a,b\n1,2\n3\n",
+    "extra_fields": "a,b\n1,2,3\n4,5,6\n",
+    "duplicate_header": "a,a\n1,3\n1,3\n",
+    "empty_header": "a,,c\n1,2,3\n4,5,6\n",
+}
+
+
+@pytest.mark.parametrize("name", sorted(PANDAS_ONLY_CASES))
+def test_read_like_pandas(name, tmp_path):
+    path = tmp_path / f"{name}.csv"
+    path.write_text(PANDAS_ONLY_CASES[name])
+    df = pd.read_csv(path)
+
+    result = CSVAnalyzer().analyze_file(path)
+
+    assert result["file_summary"]["column_names"] == df.columns.tolist()
+    assert result["file_summary"]["number_of_rows"] == len(df)
+    stats = result["statistical_summary"]["statistics"]
+    for col, mean in df.mean().items():
+        assert stats[col]["mean"] == pytest.approx(mean)
+
+
+def test_quoted_newlines_across_arrow_blocks(tmp_path, monkeypatch):
+    # Small blocks make Arrow cut the file inside quoted multi-line values
+    monkeypatch.setattr(csv_analyzer, "ARROW_BLOCK_SIZE", 256)
+    path = tmp_path / "multiline.csv"
+    path.write_text("id,text\n" + "".join(
+        f'{i},"first line\nsecond line {i}"\n' for i in range(500)
+    ))
+
+    expected, streamed = analyze_both(path, chunksize=100)
+
+    assert expected["file_summary"]["number_of_rows"] == 500
+    assert expected["statistical_summary"]["statistics"]["id"]["mean"] == 249.5
+    for actual in streamed:
+        assert_same(expected, actual)
+
+
+def test_correlations_match_pandas(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 2000
+    a = rng.normal(size=n)
+    a[rng.random(n) < 0.1] = np.nan
+    b = 2 * a + rng.normal(size=n)
+    b[[5, 9, 11]] = [np.inf, -np.inf, np.nan]
+    near_constant = np.full(n, 0.1)
+    near_constant[3] = np.nan
+    df = pd.DataFrame({
+        "a": a,
+        "b": b,
+        "constant": np.full(n, 5.0),
+        "near_constant": near_constant,
+        # Constant over the rows where a is present
+        "constant_with_a": np.where(np.isnan(a), rng.normal(size=n), 7.0),
+        "offset": 100 + rng.normal(size=n) * 1e-3,
+        "tiny": rng.normal(size=n) * 1e-8,
+    })
+    path = tmp_path / "correlations.csv"
+    df.to_csv(path, index=False)
+    expected = pd.read_csv(path).corr()
+    _, streamed = analyze_both(path, chunksize=300)
+    cases = [
+        (result["statistical_summary"]["statistics"]["correlations"], expected)
+        for result in [CSVAnalyzer().analyze_file(path), *streamed]
+    ]
+
+    # Without missing values the matrix is computed from centred data
+    complete = df[["constant", "offset", "tiny"]].assign(
+        same=0.1, other=rng.normal(size=n)
+    )
+    matrix = CSVAnalyzer()._correlation_matrix(complete)
+    cases.append((
+        csv_analyzer._correlations_to_dict(matrix, complete.columns.tolist()),
+        complete.corr(),
+    ))
+
+    for correlations, expected in cases:
+        for col, row in correlations.items():
+            for other, r in row.items():
+                assert_same(float(expected.loc[col, other]), r, f"{col}/{other}")
+
+
+def test_sniffed_dtypes_fall_back_on_late_overflow(tmp_path, monkeypatch):
+    # Force the pandas reader and its dtype sniffing on a small file
+    monkeypatch.setattr(csv_analyzer, "pacsv", None)
+    monkeypatch.setattr(csv_analyzer, "DTYPE_SNIFF_MIN_BYTES", 0)
+    monkeypatch.setattr(csv_analyzer, "DTYPE_SNIFF_ROWS", 5)
+    path = tmp_path / "overflow.csv"
+    path.write_text(
+        "a,b\n" + "".join(f"{i},{i}\n" for i in range(20)) + "99999999999999999999,1\n"
+    )
+
+    result = CSVAnalyzer().analyze_file(path)
+
+    data_types = result["file_summary"]["data_types"]
+    assert data_types == {
+        col: str(dtype) for col, dtype in pd.read_csv(path).dtypes.items()
+    }
+    assert result["file_summary"]["number_of_rows"] == 21
+
+
+@pytest.mark.parametrize("use_arrow", [True, False], ids=["arrow", "pandas"])
+def test_sample_rows_counts_parsed_rows(use_arrow, tmp_path, monkeypatch):
+    if not use_arrow:
+        monkeypatch.setattr(csv_analyzer, "pacsv", None)
+    monkeypatch.setattr(csv_analyzer, "ARROW_BLOCK_SIZE", 256)
+    path = tmp_path / "multiline.csv"
+    path.write_text("id,text\n" + "".join(
+        f'{i},"first line\nsecond line {i}"\n' for i in range(500)
+    ))
+
+    result = CSVAnalyzer().analyze_file(path, sample_rows=40)
+
+    # Quoted newlines must not be counted as rows
+    assert result["file_summary"]["number_of_rows"] == 500
+    assert result["statistical_summary"]["sample_rows"] == 40
+    assert result["statistical_summary"]["statistics"]["id"]["mean"] == 19.5
+    assert "first 40 rows" in CSVAnalyzer().format_summary(result)
+    assert CSVAnalyzer.format_as_json(result)["statistical_summary"]["sample_rows"] == 40
+
+
+def test_sample_rows_covering_the_file_is_exact(edge_csv):
+    expected = CSVAnalyzer().analyze_file(edge_csv)
+    assert_same(expected, CSVAnalyzer().analyze_file(edge_csv, sample_rows=1000))
+
+
+def pandas_statistics(path):
+    """Numerical statistics of a CSV file computed directly with pandas."""
+    numerical = pd.read_csv(path).select_dtypes("number")
+    if numerical.columns.empty:
+        return [], {}, None
+    described = numerical.describe()
+    # describe()'s 50% interpolates to NaN next to an infinity; median() does not
+    described.loc["median"] = numerical.median()
+    return numerical.columns.tolist(), described.to_dict(), numerical.corr()
+
+
+def _all_csvs():
+    yield from ((path.name, path.read_bytes()) for path in BUNDLED_CSVS)
+    for cases in (EDGE_CASES, PANDAS_ONLY_CASES):
+        yield from ((f"{name}.csv", text.encode()) for name, text in cases.items())
+
+
+@pytest.mark.parametrize(
+    "name, data", [pytest.param(*case, id=case[0]) for case in _all_csvs()]
+)
+def test_statistics_match_pandas(name, data, tmp_path):
+    path = tmp_path / name
+    path.write_bytes(data)
+    columns, described, correlations = pandas_statistics(path)
+
+    expected, streamed = analyze_both(path, chunksize=1000)
+    for result in [expected, *streamed]:
+        summary = result["statistical_summary"]
+        assert summary["numerical_columns"] == columns
+        for col in columns:
+            stats = summary["statistics"][col]
+            assert stats["count"] == described[col]["count"]
+            for key in ("mean", "median", "std", "min", "max"):
+                value = stats[key]
+                if not stats["count"]:
+                    assert value is None
+                else:
+                    assert_same(float(described[col][key]), value, f"{col}.{key}")
+        for col, row in summary["statistics"]["correlations"].items():
+            for other, r in row.items():
+                assert_same(float(correlations.loc[col, other]), r, f"{col}/{other}")
@@ -0,0 +1,67 @@
+"""Tests for the CSV analyzer Flask endpoints.
+
+Run with:
+
+    python -m pytest test_csv_analyzer_server.py
+"""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+import csv_analyzer_server as server
+from csv_analyzer_server import app
+
+
+@pytest.fixture
+def client():
+    app.config["TESTING"] = True
+    return app.test_client()
+
+
+def upload(client, files):
+    """POST (content, filename) pairs to /analyze-csv."""
+    return client.post(
+        "/analyze-csv",
+        data={"files": [(io.BytesIO(content), name) for content, name in files]},
+        content_type="multipart/form-data",
+    )
+
+
+def test_non_utf8_upload_is_a_per_file_error(client):
+    response = upload(client, [
+        ("name,value\ncafé,1\n".encode("latin-1"), "latin1.csv"),
+        (b"name,value\nbar,2\nbaz,3\n", "good.csv"),
+    ])
+
+    assert response.status_code == 200
+    latin1, good = response.get_json()["results"]
+    assert "utf-8" in latin1["error"]
+    assert good["file_summary"]["number_of_rows"] == 2
+    assert good["statistical_summary"]["numerical_columns"] == ["value"]
+
+
+def test_deferred_ai_insights_keep_every_analysis_cached(client):
+    count = server.ANALYSIS_CACHE_SIZE + 8
+    response = client.post(
+        "/analyze-csv",
+        data={
+            "files": [
+                (io.BytesIO(f"value\n{i}\n".encode()), f"file{i}.csv")
+                for i in range(count)
+            ],
+            "defer_ai_insights": "true",
+        },
+        content_type="multipart/form-data",
+    )
+
+    results = response.get_json()["results"]
+    assert len(results) == count
+    for result in results:
+        assert server.get_cached_analysis(result["analysis_id"], unpin=True) is not None
+
+    # Once fetched, entries are evictable again
+    server.store_analysis("other", {})
+    assert len(server._ANALYSIS_CACHE) <= server.ANALYSIS_CACHE_SIZE
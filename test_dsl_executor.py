@@ -0,0 +1,94 @@
+"""Tests for the DSL executor's tokenizer and path resolution.
+
+Run with:
+
+    python -m pytest test_dsl_executor.py
+"""
+
+from __future__ import annotations
+
+import os
+import shlex
+
+import pytest
+
+from dsl_executor import DSLExecutor, _needs_shlex
+
+# Argument strings after the command token, covering both tokenizer paths.
+# Vertical tab and form feed are absent: str.splitlines() ends a line there.
+ARGUMENTS = [
+    "a.txt b.txt",
+    "a.txt\tb.txt",
+    "a.txt \t  b.txt\t\tOVERWRITE",
+    '"my file.txt" dest',
+    "'my file.txt' dest",
+    'it"s quoted" here',
+    r"my\ file.txt dest",
+    r'"C:\\My Folder\\file.txt" dest',
+    "café.txt naïve.txt",
+    "no\u00a0break.txt dest",
+    "ideographic\u3000space.txt dest",
+]
+
+
+@pytest.mark.parametrize("arguments", ARGUMENTS)
+def test_tokens_match_shlex(arguments):
+    line = f"UNKNOWN_COMMAND {arguments}"
+
+    (result,) = DSLExecutor(echo=False).run_script_text(line)
+
+    assert result.args == shlex.split(line)[1:]
+
+
+@pytest.mark.parametrize("line", ["MOVE_FILE a b", "MOVE_FILE\ta  b", "LIST_FILES café"])
+def test_plain_lines_skip_shlex(line):
+    assert not _needs_shlex(line)
+
+
+def test_relative_paths_resolve_against_base_dir(tmp_path, monkeypatch):
+    base_dir = tmp_path / "base"
+    base_dir.mkdir()
+    (base_dir / "a.txt").write_text("a")
+    cwd = tmp_path / "cwd"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+
+    results = DSLExecutor(echo=False).run_script_text(
+        "CREATE_FOLDER sub\n"
+        "MOVE_FILE a.txt sub\n"
+        'RENAME_FILE "sub/a.txt" b.txt\n'
+        "GET_FILE_SIZE sub/b.txt\n",
+        base_dir=base_dir,
+    )
+
+    assert [result.success for result in results] == [True] * 4
+    assert results[-1].result == 1
+    assert (base_dir / "sub" / "b.txt").read_text() == "a"
+    assert os.getcwd() == str(cwd)
+    assert list(cwd.iterdir()) == []
+
+
+def test_absolute_paths_ignore_base_dir(tmp_path):
+    target = tmp_path / "target"
+
+    (result,) = DSLExecutor(echo=False).run_script_text(
+        f'CREATE_FOLDER "{target}"', base_dir=tmp_path / "elsewhere"
+    )
+
+    assert result.success
+    assert target.is_dir()
+    assert not (tmp_path / "elsewhere").exists()
+
+
+def test_script_file_paths_resolve_against_its_folder(tmp_path, monkeypatch):
+    script = tmp_path / "scripts" / "organize.dsl"
+    script.parent.mkdir()
+    script.write_text("CREATE_FOLDER out\n")
+    monkeypatch.chdir(tmp_path)
+
+    (result,) = DSLExecutor(echo=False).run_script_file(script)
+
+    assert result.success
+    assert (script.parent / "out").is_dir()
+    assert not (tmp_path / "out").exists()
+    assert os.getcwd() == str(tmp_path)
@@ -3,13 +3,23 @@
     python test_file_manager.py <folder_path>
 
 If no argument is provided, it will use the DEFAULT_TEST_FOLDER below.
+
+The test_* functions run under pytest on temporary folders:
+
+    python -m pytest test_file_manager.py
 """
 
 from __future__ import annotations
 
+import ctypes
+import errno
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
+import file_manager
 from file_manager import (
     list_files_in_folder,
     get_file_name,
@@ -117,6 +127,112 @@ def main() -> None:
     print("\nDone. Check the printed output and your filesystem to see the effects.")
 
 
+def test_move_file_creates_missing_destination_folder(tmp_path):
+    src = tmp_path / "a.txt"
+    src.write_text("a")
+    dest = tmp_path / "new" / "nested" / "b.txt"
+
+    assert move_file(src, dest) == dest
+    assert dest.read_text() == "a"
+    assert not src.exists()
+
+
+def test_move_file_into_existing_folder_keeps_name(tmp_path):
+    src = tmp_path / "a.txt"
+    src.write_text("a")
+    (tmp_path / "folder").mkdir()
+
+    assert move_file(src, tmp_path / "folder") == tmp_path / "folder" / "a.txt"
+    assert (tmp_path / "folder" / "a.txt").read_text() == "a"
+
+
+def test_move_file_overwrite(tmp_path):
+    src = tmp_path / "a.txt"
+    src.write_text("new")
+    dest = tmp_path / "b.txt"
+    dest.write_text("old")
+
+    with pytest.raises(FileExistsError):
+        move_file(src, dest)
+    assert src.read_text() == "new"
+    assert dest.read_text() == "old"
+
+    assert move_file(src, dest, overwrite=True) == dest
+    assert dest.read_text() == "new"
+    assert not src.exists()
+
+
+@pytest.mark.parametrize("folder", ["", "missing"])
+def test_move_file_across_devices(folder, tmp_path, monkeypatch):
+    def cross_device(src, dest):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV), str(src), None, str(dest))
+
+    monkeypatch.setattr(file_manager.os, "replace", cross_device)
+    src = tmp_path / "a.txt"
+    src.write_text("a")
+    dest = tmp_path / folder / "b.txt"
+
+    assert move_file(src, dest) == dest
+    assert dest.read_text() == "a"
+    assert not src.exists()
+
+
+def test_move_file_reraises_other_errors(tmp_path, monkeypatch):
+    def denied(src, dest):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES))
+
+    monkeypatch.setattr(file_manager.os, "replace", denied)
+    src = tmp_path / "a.txt"
+    src.write_text("a")
+
+    with pytest.raises(PermissionError):
+        move_file(src, tmp_path / "b.txt")
+    assert src.exists()
+
+
+@pytest.fixture(params=[True, False], ids=["statx", "no_statx"])
+def statx_available(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(file_manager, "_statx", None)
+    return request.param
+
+
+@pytest.mark.parametrize("size", [0, 1, 4096, 1 << 20])
+def test_file_size_matches_stat(size, statx_available, tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"x" * size)
+
+    fast = file_manager._fast_size(path)
+    if statx_available and file_manager._statx is not None:
+        assert fast == os.stat(path).st_size
+    else:
+        assert fast is None
+    assert get_file_size(path) == os.stat(path).st_size
+
+
+def test_file_size_rejects_folders_and_missing_files(statx_available, tmp_path):
+    assert file_manager._fast_size(tmp_path) is None
+    with pytest.raises(IsADirectoryError):
+        get_file_size(tmp_path)
+    assert file_manager._fast_size(tmp_path / "missing") is None
+    with pytest.raises(FileNotFoundError):
+        get_file_size(tmp_path / "missing")
+
+
+def test_fast_size_disables_statx_without_kernel_support(tmp_path, monkeypatch):
+    def unsupported(*args):
+        ctypes.set_errno(errno.ENOSYS)
+        return -1
+
+    monkeypatch.setattr(file_manager, "_statx", unsupported)
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"abc")
+
+    assert file_manager._fast_size(path) is None
+    assert file_manager._statx is None
+    assert get_file_size(path) == 3
+
+
 if __name__ == "__main__":
     main()
 
@@ -0,0 +1,87 @@
+"""Tests for the organizer's handling of streamed OpenAI completions.
+
+Run with:
+
+    python -m pytest test_file_organizer.py
+"""
+
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from file_organizer import _FencedCodeEcho, _strip_code_fences, call_openai_api
+
+SCRIPT = 'CREATE_FOLDER docs\nMOVE_FILE "a b.txt" docs\n\nRENAME_FILE c.txt d.txt'
+
+COMPLETIONS = {
+    "unfenced": SCRIPT,
+    "fenced": f"```dsl\n{SCRIPT}\n```",
+    "fenced_untagged": f"```\n{SCRIPT}\n```\n",
+    "surrounding_whitespace": f"  \n\n```dsl\n{SCRIPT}\n```  \n\n",
+    "blank_line_before_fence": f"```\n{SCRIPT}\n\n```",
+    "unclosed_fence": f"```dsl\n{SCRIPT}\n",
+    "fence_only": "```",
+    "empty": "",
+}
+
+
+def split_every(text, size):
+    """Deltas of at most size characters."""
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("unfenced", SCRIPT),
+    ("fenced", SCRIPT),
+    ("fenced_untagged", SCRIPT),
+    ("surrounding_whitespace", SCRIPT),
+    ("blank_line_before_fence", SCRIPT + "\n"),
+    ("unclosed_fence", SCRIPT),
+    ("fence_only", ""),
+    ("empty", ""),
+])
+def test_strip_code_fences(name, expected):
+    assert _strip_code_fences(COMPLETIONS[name]) == expected
+
+
+@pytest.mark.parametrize("name", sorted(COMPLETIONS))
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_echo_equals_stripped_code(name, size):
+    text = COMPLETIONS[name]
+    echo = _FencedCodeEcho()
+
+    pieces = [echo.feed(delta) for delta in split_every(text, size)]
+    pieces.append(echo.finish())
+
+    assert "".join(pieces) == _strip_code_fences(text)
+    # Lines are echoed whole, never a fence
+    assert not any("```" in piece for piece in pieces)
+
+
+def fake_openai(deltas):
+    """Stand-in for the openai module whose client streams the given deltas."""
+    chunks = [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=d))])
+        for d in deltas
+    ]
+    completions = SimpleNamespace(create=lambda **kwargs: iter(chunks))
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return SimpleNamespace(OpenAI=lambda api_key: client)
+
+
+def test_call_openai_api_echoes_the_returned_code(monkeypatch):
+    monkeypatch.setitem(
+        sys.modules, "openai", fake_openai(split_every(COMPLETIONS["fenced"], 5))
+    )
+    analysis = {"folder_path": "/tmp", "folder_name": "tmp", "file_count": 0, "files": []}
+    echoed = []
+
+    code = call_openai_api("key", analysis, "", on_text=echoed.append)
+
+    assert code == SCRIPT
+    assert "".join(echoed) == SCRIPT
+    # Settled lines are echoed before the stream ends
+    assert len(echoed) > 1